@@ -1,5 +1,5 @@
-import requests
-import time
+from .client import RiotClient
+import asyncio
 
 
 class Core:
@@ -28,48 +28,36 @@ class Core:
         "vn2": "https://vn2.api.riotgames.com",
     }
 
-    def __init__(self, api_key_path="donotpush/riot_api_key.txt"):
-        self.api_key = self._load_api_key(api_key_path)
-        self.request_times = []
+    def __init__(self, client=None, api_key_path=RiotClient.API_KEY_PATH):
+        if client is None:
+            client = (
+                RiotClient.default()
+                if api_key_path == RiotClient.API_KEY_PATH
+                else RiotClient(api_key_path)
+            )
+        self.client = client
 
-    def _load_api_key(self, path):
-        with open(path, "r") as f:
-            return f.read().strip()
+    def _make_request(self, url, params=None, method=None, parser=None):
+        # method: Riot's endpoint name, used for the per-method rate limits
+        return self.client.request(url, params, method, parser)
 
-    def _make_request(self, url, params=None):
-        # 20 requests par seconde, 100 tt les 2 minutes
-        self._wait_for_rate_limit()
-
-        headers = {"X-Riot-Token": self.api_key}
-        response = requests.get(url, headers=headers, params=params)
-
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", 1))
-            print(f"Rate limit hit, waiting {retry_after} seconds...")
-            time.sleep(retry_after)
-            return self._make_request(url, params)
-        else:
-            print(f"Error {response.status_code}: {response.text}")
-            return None
-
-    def _wait_for_rate_limit(self):
-        now = time.time()
-
-        self.request_times = [t for t in self.request_times if now - t < 120]
+    def _build_region_url(self, region, path):
+        base = self.client.base_urls.get(region) or self.REGION_URLS[region]
+        return f"{base}{path}"
 
-        if len(self.request_times) >= 95:
-            sleep_time = 120 - (now - self.request_times[0])
-            if sleep_time > 0:
-                print(f"Rate limit protection: waiting {sleep_time:.1f}s")
-                time.sleep(sleep_time)
-                self.request_times = []
+    def _build_server_url(self, platform, path):
+        base = self.client.base_urls.get(platform) or self.SERVERS_URLS[platform]
+        return f"{base}{path}"
 
-        self.request_times.append(now)
 
-    def _build_region_url(self, region, path):
-        return f"{self.REGION_URLS[region]}{path}"
+class AsyncCore(Core):
+    # Endpoint methods that only return self._make_request(...) become awaitable
+    # as-is, so async endpoints can simply mix this in front of the sync class.
+    async def _make_request(self, url, params=None, method=None, parser=None):
+        return await self.client.request_async(url, params, method, parser)
 
-    def _build_server_url(self, platform, path):
-        return f"{self.SERVERS_URLS[platform]}{path}"
+    async def _run_blocking(self, fn, *args):
+        # Cache and store I/O (SQLite) runs on the client's io_executor, never on the
+        # event loop and never queued behind requests waiting for a thread
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.client.io_executor, fn, *args)
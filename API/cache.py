@@ -0,0 +1,239 @@
+from collections import OrderedDict
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class MatchCache:
+    # Finished matches and timelines never change: keep them forever, keyed by match ID
+    def __init__(self, path="cache/matches.sqlite3"):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS payloads ("
+            " kind TEXT NOT NULL,"
+            " match_id TEXT NOT NULL,"
+            " data BLOB NOT NULL,"
+            " PRIMARY KEY (kind, match_id))"
+        )
+        self.conn.commit()
+
+    def _encode(self, data):
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    def _decode(self, blob):
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+    def get(self, kind, match_id):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT data FROM payloads WHERE kind = ? AND match_id = ?",
+                (kind, match_id),
+            ).fetchone()
+
+        return self._decode(row[0]) if row else None
+
+    def get_many(self, kind, match_ids):
+        found = {}
+        match_ids = list(match_ids)
+
+        # SQLite caps bound parameters, stay well under it
+        for i in range(0, len(match_ids), 500):
+            chunk = match_ids[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            with self.lock:
+                rows = self.conn.execute(
+                    f"SELECT match_id, data FROM payloads"
+                    f" WHERE kind = ? AND match_id IN ({placeholders})",
+                    (kind, *chunk),
+                ).fetchall()
+
+            for match_id, blob in rows:
+                found[match_id] = self._decode(blob)
+
+        return found
+
+    def missing(self, kind, match_ids):
+        # Only the keys: tells what is left to download without decoding payloads
+        match_ids = list(match_ids)
+        stored = set()
+
+        for i in range(0, len(match_ids), 500):
+            chunk = match_ids[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            with self.lock:
+                rows = self.conn.execute(
+                    f"SELECT match_id FROM payloads"
+                    f" WHERE kind = ? AND match_id IN ({placeholders})",
+                    (kind, *chunk),
+                ).fetchall()
+            stored.update(row[0] for row in rows)
+
+        return [match_id for match_id in match_ids if match_id not in stored]
+
+    def put(self, kind, match_id, data):
+        if not data:
+            return
+
+        blob = self._encode(data)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO payloads (kind, match_id, data) VALUES (?, ?, ?)",
+                (kind, match_id, blob),
+            )
+            self.conn.commit()
+
+    def __contains__(self, key):
+        kind, match_id = key
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM payloads WHERE kind = ? AND match_id = ?",
+                (kind, match_id),
+            ).fetchone()
+        return row is not None
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class TTLCache:
+    # In-memory LRU for slowly changing endpoints; ttl=None never expires
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires = time.monotonic() + ttl if ttl is not None else None
+        with self.lock:
+            self.entries[key] = (value, expires)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SyncStore:
+    # Per-PUUID sync cursor, the ID lists of months that can no longer change and
+    # the ID lists of bulk downloads that haven't finished yet
+    def __init__(self, path="cache/matches.sqlite3"):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS sync_cursors ("
+            " puuid TEXT PRIMARY KEY,"
+            " last_timestamp INTEGER NOT NULL,"
+            " match_ids TEXT NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS month_match_ids ("
+            " puuid TEXT NOT NULL,"
+            " month TEXT NOT NULL,"
+            " match_ids TEXT NOT NULL,"
+            " PRIMARY KEY (puuid, month))"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS download_jobs ("
+            " job TEXT PRIMARY KEY,"
+            " match_ids TEXT NOT NULL,"
+            " started REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    def get_cursor(self, puuid):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT last_timestamp, match_ids FROM sync_cursors WHERE puuid = ?",
+                (puuid,),
+            ).fetchone()
+
+        if not row:
+            return None
+        return row[0], json.loads(row[1])
+
+    def set_cursor(self, puuid, last_timestamp, match_ids):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sync_cursors (puuid, last_timestamp, match_ids)"
+                " VALUES (?, ?, ?)",
+                (puuid, last_timestamp, json.dumps(match_ids)),
+            )
+            self.conn.commit()
+
+    def get_month_ids(self, puuid, month):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT match_ids FROM month_match_ids WHERE puuid = ? AND month = ?",
+                (puuid, month),
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def put_month_ids(self, puuid, month, match_ids):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO month_match_ids (puuid, month, match_ids)"
+                " VALUES (?, ?, ?)",
+                (puuid, month, json.dumps(match_ids)),
+            )
+            self.conn.commit()
+
+    def get_job(self, job):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT match_ids FROM download_jobs WHERE job = ?", (job,)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def put_job(self, job, match_ids):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO download_jobs (job, match_ids, started)"
+                " VALUES (?, ?, ?)",
+                (job, json.dumps(match_ids), time.time()),
+            )
+            self.conn.commit()
+
+    def delete_job(self, job):
+        with self.lock:
+            self.conn.execute("DELETE FROM download_jobs WHERE job = ?", (job,))
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
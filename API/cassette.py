@@ -0,0 +1,129 @@
+from requests.structures import CaseInsensitiveDict
+import gzip
+import io
+import json
+import threading
+import time
+
+
+# Only what Core reacts to, the rest of Riot's headers is noise in a cassette
+RECORDED_HEADERS = ("content-type", "retry-after")
+RATE_LIMIT_HEADER_PREFIX = ("x-app-rate-limit", "x-method-rate-limit", "x-rate-limit")
+
+
+def request_key(url, params=None):
+    return url, tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+
+
+class Cassette:
+    # Gzipped JSON lines, one recorded response per line, replayed in recorded order
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    @classmethod
+    def load(cls, path):
+        cassette = cls(path)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                key = request_key(entry["url"], dict(entry["params"]))
+                cassette.entries.setdefault(key, []).append(entry)
+        return cassette
+
+    def record(self, url, params, response):
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() in RECORDED_HEADERS
+            or name.lower().startswith(RATE_LIMIT_HEADER_PREFIX)
+        }
+        entry = {
+            "url": url,
+            "params": sorted((k, str(v)) for k, v in (params or {}).items()),
+            "status": response.status_code,
+            "headers": headers,
+            "body": response.content.decode("utf-8"),
+        }
+        with self.lock:
+            self.entries.setdefault(request_key(url, params), []).append(entry)
+
+    def save(self):
+        with self.lock:
+            with gzip.open(self.path, "wt", encoding="utf-8") as f:
+                for responses in self.entries.values():
+                    for entry in responses:
+                        f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def __len__(self):
+        return sum(len(responses) for responses in self.entries.values())
+
+
+class CassetteResponse:
+    # The parts of requests.Response that RiotClient and the stream parsers touch
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.raw = io.BytesIO(content)
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1):
+        while True:
+            chunk = self.raw.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+class RecordingTransport:
+    def __init__(self, session, cassette):
+        self.session = session
+        self.cassette = cassette
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        response = self.session.get(url, params=params, timeout=timeout)
+        self.cassette.record(url, params, response)
+        return response
+
+
+class ReplayTransport:
+    def __init__(self, cassette, latency=0.0, rate_limited=False):
+        self.cassette = cassette
+        self.latency = latency
+        # Off by default: replays run as fast as the code allows, not at the recorded budget
+        self.rate_limited = rate_limited
+        self.lock = threading.Lock()
+        self.positions = {}
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        key = request_key(url, params)
+        responses = self.cassette.entries.get(key)
+        if not responses:
+            raise LookupError(f"Not in cassette {self.cassette.path}: {url} {params}")
+
+        with self.lock:
+            # Same request several times: replay them in order, then repeat the last one
+            position = self.positions.get(key, 0)
+            self.positions[key] = position + 1
+        entry = responses[min(position, len(responses) - 1)]
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        headers = entry["headers"]
+        if not self.rate_limited:
+            headers = {
+                name: value
+                for name, value in headers.items()
+                if not name.lower().startswith(RATE_LIMIT_HEADER_PREFIX)
+            }
+
+        return CassetteResponse(entry["status"], headers, entry["body"].encode("utf-8"))
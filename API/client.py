@@ -0,0 +1,391 @@
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import asyncio
+import threading
+import time
+
+from .cache import MatchCache, SyncStore, TTLCache
+from .cassette import Cassette, RecordingTransport, ReplayTransport
+from .metrics import Metrics
+from .ratelimit import RateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+from .scheduler import AsyncFetchScheduler, FetchScheduler
+from .singleflight import SingleFlight
+
+
+class RiotClient:
+    # 4 regional hosts + 15 platform hosts, one keep-alive pool each
+    POOL_CONNECTIONS = 20
+    POOL_MAXSIZE = 10
+    LANE_WORKERS = 4
+    MAX_IN_FLIGHT = 32
+    IO_WORKERS = 4
+    SCHEDULER_WORKERS = 4
+    TIMEOUT = 10
+    MATCH_CACHE_PATH = "cache/matches.sqlite3"
+
+    # _attempt outcomes that send the request again
+    RETRY = object()
+    RATE_LIMITED = object()
+
+    # Seconds a profile response stays fresh, None = forever (PUUIDs never change)
+    RESPONSE_TTLS = {
+        "account-v1.getByRiotId": None,
+        "summoner-v4.getByPUUID": 60 * 60,
+        "league-v4.getLeagueEntriesByPUUID": 5 * 60,
+        "league-v4.getLeagueEntriesForSummoner": 5 * 60,
+        "champion-mastery-v4.getAllChampionMasteriesByPUUID": 6 * 60 * 60,
+        "champion-mastery-v4.getTopChampionMasteriesByPUUID": 6 * 60 * 60,
+    }
+
+    API_KEY_PATH = "donotpush/riot_api_key.txt"
+
+    # Process-wide client behind default()
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key_path=API_KEY_PATH,
+        rate_limiter=None,
+        lane_workers=LANE_WORKERS,
+        api_key=None,
+        base_urls=None,
+        max_in_flight=MAX_IN_FLIGHT,
+        cache_path=MATCH_CACHE_PATH,
+        response_cache=None,
+        response_ttls=None,
+        retry_policy=None,
+        circuit_breaker=None,
+        timeout=TIMEOUT,
+        metrics=None,
+        record_to=None,
+        replay_from=None,
+        replay_latency=0.0,
+        replay_rate_limited=False,
+    ):
+        # Replaying a cassette needs neither the network nor a key. Nothing is read
+        # from or written to the on-disk match cache either: a replay only sees
+        # what the cassette holds
+        self.cassette = Cassette.load(replay_from) if replay_from else None
+        if self.cassette:
+            api_key = api_key or "replay"
+            rate_limiter = rate_limiter or RateLimiter(app_limits=None)
+            cache_path = None
+
+        self.api_key = api_key or self._load_api_key(api_key_path)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.timeout = timeout
+        self.metrics = metrics or Metrics()
+
+        # Same URL + params already on the wire: wait for it instead of sending again
+        self.inflight = SingleFlight()
+
+        # {"europe": "http://localhost:8080", ...} to point routing values elsewhere
+        self.base_urls = base_urls or {}
+
+        # One worker lane per routing value, each draining its own rate budget
+        self.lane_workers = lane_workers
+        self._lanes = {}
+        self._lanes_lock = threading.Lock()
+
+        # Shared by every async endpoint: caps requests in flight, not players
+        self.max_in_flight = max_in_flight
+        self._executor = None
+        # SQLite reads and writes of the async paths, never stuck behind requests
+        self._io_executor = None
+        self._scheduler = None
+        # event loop -> AsyncFetchScheduler, see async_scheduler
+        self._async_schedulers = {}
+
+        # cache_path=None to always hit the network
+        self.match_cache = MatchCache(cache_path) if cache_path else None
+        self.sync_store = SyncStore(cache_path) if cache_path else None
+
+        # Pass the same TTLCache to several clients to share it between them too
+        self.response_cache = response_cache or TTLCache()
+        self.response_ttls = dict(self.RESPONSE_TTLS, **(response_ttls or {}))
+
+        self.session = requests.Session()
+        self.session.headers.update({"X-Riot-Token": self.api_key})
+
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=max(self.POOL_MAXSIZE, max_in_flight),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Everything goes through transport.get: the session, or a cassette around it
+        if self.cassette:
+            # replay_rate_limited: pace the replay with the recorded rate limit headers
+            self.transport = ReplayTransport(
+                self.cassette, latency=replay_latency, rate_limited=replay_rate_limited
+            )
+        elif record_to:
+            self.cassette = Cassette(record_to)
+            self.transport = RecordingTransport(self.session, self.cassette)
+        else:
+            self.transport = self.session
+        self.recording = bool(record_to) and not replay_from
+
+    @classmethod
+    def default(cls):
+        # What Player, PlayerGroup and the endpoint classes use when given no client:
+        # one key means one rate budget and one response cache for the whole process
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _load_api_key(self, path):
+        with open(path, "r") as f:
+            return f.read().strip()
+
+    def request(self, url, params=None, method=None, parser=None):
+        # parser(response) replaces response.json(), the body is then streamed to it
+        key = (url, tuple(sorted((params or {}).items())), parser)
+        cacheable = method in self.response_ttls
+
+        if cacheable:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                return cached
+
+        data = self.inflight.do(key, lambda: self._send(url, params, method, parser))
+
+        if cacheable and data is not None:
+            self.response_cache.set(key, data, self.response_ttls[method])
+        return data
+
+    async def request_async(self, url, params=None, method=None, parser=None):
+        # request() for AsyncCore. The waits for an open circuit and the rate limit
+        # run on the event loop, so a host out of budget holds no executor thread
+        # and calls to other hosts go straight through
+        key = (url, tuple(sorted((params or {}).items())), parser)
+        cacheable = method in self.response_ttls
+
+        if cacheable:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                return cached
+
+        host = urlparse(url).netloc
+        delay = self.circuit_breaker.retry_in(host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._observe_rate_limit_wait(
+            host, await self.rate_limiter.acquire_async(host, method)
+        )
+
+        # The slot is taken: the first attempt goes out as soon as a thread is free.
+        # Retries after a 429 or a 5xx still wait in the thread
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(
+            self.executor,
+            self.inflight.do,
+            key,
+            lambda: self._send(url, params, method, parser, reserved=True),
+        )
+
+        if cacheable and data is not None:
+            self.response_cache.set(key, data, self.response_ttls[method])
+        return data
+
+    def _send(self, url, params=None, method=None, parser=None, reserved=False):
+        host = urlparse(url).netloc
+        policy = self.retry_policy
+        attempt = 0
+        rate_limited = 0
+
+        # An open circuit holds the request until the half-open trial settles it
+        if not self.circuit_breaker.wait(host):
+            print(f"Circuit open for {host}, skipping {url}")
+            return None
+
+        try:
+            while attempt < policy.max_attempts:
+                result = self._attempt(
+                    host, url, params, method, parser, attempt, reserved
+                )
+                # reserved: request_async already took the first attempt's slot
+                reserved = False
+
+                if result is self.RATE_LIMITED:
+                    rate_limited += 1
+                    if rate_limited > policy.max_rate_limited:
+                        print(f"Giving up on {url} after {rate_limited} rate limit responses")
+                        return None
+                    continue
+                if result is not self.RETRY:
+                    return result
+                attempt += 1
+
+            # One failure for the host per request, whatever the number of attempts
+            self.circuit_breaker.record_failure(host)
+            print(f"Giving up on {url} after {policy.max_attempts} attempts")
+            return None
+        finally:
+            # Ended without a verdict (rate limited, parser error): free the trial
+            self.circuit_breaker.release_trial(host)
+
+    def _attempt(self, host, url, params, method, parser, attempt, reserved=False):
+        policy = self.retry_policy
+        if not reserved:
+            self._wait_for_rate_limit(host, method)
+
+        started = time.monotonic()
+        try:
+            response = self.transport.get(
+                url, params=params, timeout=self.timeout, stream=parser is not None
+            )
+            if response.status_code == 200:
+                data = parser(response) if parser else response.json()
+        except (
+            requests.Timeout,
+            requests.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+        ) as e:
+            self.metrics.observe_retry(method, type(e).__name__)
+            delay = policy.backoff(attempt)
+            print(f"{type(e).__name__} on {url}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+            return self.RETRY
+
+        self.metrics.observe_request(
+            method,
+            response.status_code,
+            time.monotonic() - started,
+            self._response_size(response, parser),
+        )
+        self.rate_limiter.update(host, method, response.headers, sent=started)
+
+        if response.status_code == 200:
+            self.circuit_breaker.record_success(host)
+            return data
+        elif response.status_code == 429:
+            # Not a host failure: the limiter holds every caller back for Retry-After
+            retry_after = int(response.headers.get("Retry-After", 1))
+            limit_type = response.headers.get("X-Rate-Limit-Type")
+            print(f"Rate limit hit ({limit_type}), waiting {retry_after} seconds...")
+            self.rate_limiter.block(
+                host, retry_after, method if limit_type == "method" else None
+            )
+            self.metrics.observe_retry(method, "429")
+            return self.RATE_LIMITED
+        elif policy.should_retry(response.status_code):
+            self.metrics.observe_retry(method, str(response.status_code))
+            delay = policy.backoff(attempt)
+            if "Retry-After" in response.headers:
+                delay = max(delay, int(response.headers["Retry-After"]))
+            print(f"Error {response.status_code} on {url}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+            return self.RETRY
+        else:
+            # 4xx: the request itself is wrong, retrying won't help
+            self.circuit_breaker.record_success(host)
+            print(f"Error {response.status_code}: {response.text}")
+            return None
+
+    def _response_size(self, response, parser):
+        if parser and response.status_code == 200:
+            # Streamed: the body went to the parser, ask urllib3 how much it read
+            return response.raw.tell()
+        return len(response.content)
+
+    def _wait_for_rate_limit(self, host, method=None):
+        self._observe_rate_limit_wait(host, self.rate_limiter.acquire(host, method))
+
+    def _observe_rate_limit_wait(self, host, waited):
+        self.metrics.observe_rate_limit_wait(host, waited)
+        if waited >= 1:
+            print(f"Rate limit protection ({host}): waited {waited:.1f}s")
+
+    def submit(self, routing, fn, *args, **kwargs):
+        # routing: "europe", "euw1", ... calls on different hosts run side by side
+        with self._lanes_lock:
+            if routing not in self._lanes:
+                self._lanes[routing] = ThreadPoolExecutor(
+                    max_workers=self.lane_workers, thread_name_prefix=f"riot-{routing}"
+                )
+            lane = self._lanes[routing]
+
+        return lane.submit(fn, *args, **kwargs)
+
+    @property
+    def executor(self):
+        with self._lanes_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_in_flight, thread_name_prefix="riot-async"
+                )
+            return self._executor
+
+    @property
+    def io_executor(self):
+        with self._lanes_lock:
+            if self._io_executor is None:
+                self._io_executor = ThreadPoolExecutor(
+                    max_workers=self.IO_WORKERS, thread_name_prefix="riot-io"
+                )
+            return self._io_executor
+
+    @property
+    def scheduler(self):
+        # Shared by every Player on this client, so priorities apply across players
+        with self._lanes_lock:
+            if self._scheduler is None:
+                self._scheduler = FetchScheduler(self.SCHEDULER_WORKERS)
+            return self._scheduler
+
+    @property
+    def async_scheduler(self):
+        # scheduler for AsyncPlayer, one per event loop (asyncio.run() opens a new
+        # one each time). As few workers as the threaded one, or every queued job
+        # would be started at once and wait on the rate limit in no given order
+        loop = asyncio.get_running_loop()
+        with self._lanes_lock:
+            self._async_schedulers = {
+                owner: scheduler
+                for owner, scheduler in self._async_schedulers.items()
+                if not owner.is_closed()
+            }
+            if loop not in self._async_schedulers:
+                self._async_schedulers[loop] = AsyncFetchScheduler(
+                    self.SCHEDULER_WORKERS
+                )
+            return self._async_schedulers[loop]
+
+    def close(self):
+        with RiotClient._default_lock:
+            # The next default() opens a fresh one
+            if RiotClient._default is self:
+                RiotClient._default = None
+        # Swap everything out under the lock, shut it down after: scheduler workers
+        # still running may need the lock (client.scheduler, submit) to finish
+        with self._lanes_lock:
+            scheduler, self._scheduler = self._scheduler, None
+            lanes, self._lanes = self._lanes, {}
+            executor, self._executor = self._executor, None
+            io_executor, self._io_executor = self._io_executor, None
+            # Their worker tasks end with their loops
+            self._async_schedulers = {}
+        if scheduler is not None:
+            scheduler.shutdown(wait=True)
+        for lane in lanes.values():
+            lane.shutdown(wait=True)
+        for pool in (executor, io_executor):
+            if pool is not None:
+                pool.shutdown(wait=True)
+        self.session.close()
+        if self.recording:
+            self.cassette.save()
+            print(f"Recorded {len(self.cassette)} responses to {self.cassette.path}")
+        if self.match_cache:
+            self.match_cache.close()
+        if self.sync_store:
+            self.sync_store.close()
@@ -1,12 +1,20 @@
-from ..Core import Core
+from ..Core import Core, AsyncCore
 
 
 class ChampionMastery(Core):
     def get_all_masteries(self, puuid, platform="euw1"):
         url = self._build_server_url(platform, f"/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}")
-        return self._make_request(url)
+        return self._make_request(
+            url, method="champion-mastery-v4.getAllChampionMasteriesByPUUID"
+        )
 
     def get_top_masteries(self, puuid, platform="euw1", count=10):
         url = self._build_server_url(platform, f"/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/top")
         params = {"count": count}
-        return self._make_request(url, params=params)
+        return self._make_request(
+            url, params=params, method="champion-mastery-v4.getTopChampionMasteriesByPUUID"
+        )
+
+
+class AsyncChampionMastery(AsyncCore, ChampionMastery):
+    pass
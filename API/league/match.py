@@ -1,12 +1,29 @@
-from ..Core import Core
+from ..Core import Core, AsyncCore
+from .timeline import compact_timeline, parse_timeline_stream
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import asyncio
 import time
 
 
 class Match(Core):
+    # Riot lists a game some time after it ends, and a game started just before
+    # midnight ends the next day: a month is only final this long after its end
+    MONTH_GRACE = 2 * 24 * 60 * 60
+
     def get_match_history(
-        self, puuid, region="europe", count=20, start=0, start_time=None, end_time=None
+        self,
+        puuid,
+        region="europe",
+        count=20,
+        start=0,
+        start_time=None,
+        end_time=None,
+        queue=None,
+        match_type=None,
     ):
+        # queue (420 = ranked solo, ...) and match_type ("ranked", "normal", ...) are
+        # filtered by Riot, so excluded games never cost a detail call
         url = self._build_region_url(
             region, f"/lol/match/v5/matches/by-puuid/{puuid}/ids"
         )
@@ -16,63 +33,279 @@ class Match(Core):
             params["startTime"] = start_time
         if end_time:
             params["endTime"] = end_time
+        if queue is not None:
+            params["queue"] = queue
+        if match_type:
+            params["type"] = match_type
 
-        return self._make_request(url, params=params)
+        return self._make_request(
+            url, params=params, method="match-v5.getMatchIdsByPUUID"
+        )
 
     def get_match_details(self, match_id, region="europe"):
-        url = self._build_region_url(region, f"/lol/match/v5/matches/{match_id}")
-        return self._make_request(url)
+        cached = self._cache_get("match", match_id)
+        if cached:
+            return cached
+        return self._download_match(match_id, region)
 
-    def get_match_timeline(self, match_id, region="europe"):
+    def _download_match(self, match_id, region="europe"):
+        # No cache lookup: for callers that already know it's a miss
+        url = self._build_region_url(region, f"/lol/match/v5/matches/{match_id}")
+        data = self._make_request(url, method="match-v5.getMatch")
+        self._cache_put("match", match_id, data)
+        return data
+
+    def get_match_timeline(self, match_id, region="europe", compact=False):
+        # compact: stream-parse and keep only the fields the analysis reads (timeline.py)
+        cached = self._cached_timeline(match_id, compact)
+        if cached:
+            return cached
+        return self._download_timeline(match_id, region, compact)
+
+    def _download_timeline(self, match_id, region="europe", compact=False):
         url = self._build_region_url(
             region, f"/lol/match/v5/matches/{match_id}/timeline"
         )
-        return self._make_request(url)
-
-    def get_year_match_history(self, puuid, region="europe", year=2024):
+        data = self._make_request(
+            url,
+            method="match-v5.getTimeline",
+            parser=parse_timeline_stream if compact else None,
+        )
+        self._cache_put(self._timeline_kind(compact), match_id, data)
+        return data
+
+    def _timeline_kind(self, compact):
+        return "timeline_compact" if compact else "timeline"
+
+    def _cached_timeline(self, match_id, compact):
+        cached = self._cache_get(self._timeline_kind(compact), match_id)
+        if cached or not compact:
+            return cached
+
+        full = self._cache_get("timeline", match_id)
+        return compact_timeline(full) if full else None
+
+    def _cached_timelines(self, match_ids, compact):
+        # Bulk _cached_timeline: one query per kind instead of one per match
+        cached = self._cache_get_many(self._timeline_kind(compact), match_ids)
+        if compact:
+            full = self._cache_get_many(
+                "timeline", [match_id for match_id in match_ids if match_id not in cached]
+            )
+            for match_id, timeline in full.items():
+                cached[match_id] = compact_timeline(timeline)
+        return cached
+
+    def _cache_get(self, kind, match_id):
+        if self.client.match_cache:
+            return self.client.match_cache.get(kind, match_id)
+        return None
+
+    def _cache_put(self, kind, match_id, data):
+        if self.client.match_cache and data:
+            self.client.match_cache.put(kind, match_id, data)
+
+    def _cache_get_many(self, kind, match_ids):
+        if self.client.match_cache:
+            return self.client.match_cache.get_many(kind, match_ids)
+        return {}
+
+    def get_year_match_history(
+        self,
+        puuid,
+        region="europe",
+        year=2024,
+        workers=4,
+        *,
+        queue=None,
+        match_type=None,
+        return_complete=False,
+    ):
+        # return_complete: also say whether every page of every month was listed.
+        # The filters are keyword-only, AsyncMatch takes the same arguments
         print(f"\n{'=' * 60}")
         print(f"  Fetching all matches for {year}")
         print(f"{'=' * 60}\n")
 
-        all_match_ids = []
-
-        for month in range(1, 13):
+        # Pacing is the rate limiter's job, months are paged side by side
+        def fetch_month(month):
             start_time, end_time = self._get_month_timestamps(year, month)
-            month_name = self._get_month_name(year, month)
-
-            print(f"{month_name}...", end=" ")
-
-            month_matches = self._fetch_matches_with_pagination(
-                puuid, region, start_time, end_time
+            return self._fetch_month_ids(
+                puuid, region, year, month, start_time, end_time, queue, match_type
             )
 
-            all_match_ids.extend(month_matches)
-            print(f"{len(month_matches)} matches")
+        months = range(1, 13)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            month_results = list(pool.map(fetch_month, months))
+        month_matches = [matches for matches, _ in month_results]
+        complete = all(month_complete for _, month_complete in month_results)
+
+        for month, matches in zip(months, month_matches):
+            print(f"{self._get_month_name(year, month)}... {len(matches)} matches")
 
-            time.sleep(0.5)
+        all_match_ids = self._merge_month_ids(month_matches)
 
         print(f"\n{'=' * 60}")
         print(f"Total: {len(all_match_ids)} matches")
         print(f"{'=' * 60}\n")
 
+        if return_complete:
+            return all_match_ids, complete
         return all_match_ids
 
-    def get_bulk_match_details(self, match_ids, region="europe"):
-        print(f"Fetching details for {len(match_ids)} matches...")
+    def _fetch_month_ids(
+        self, puuid, region, year, month, start_time, end_time, queue=None, match_type=None
+    ):
+        # A month that is over never gets new matches: list it once, then reuse it
+        store = self.client.sync_store
+        closed = end_time + self.MONTH_GRACE <= time.time()
+        key = f"{year}-{month:02d}{self.filter_key(queue, match_type)}"
+
+        if store and closed:
+            cached = store.get_month_ids(puuid, key)
+            if cached is not None:
+                return cached, True
+
+        match_ids, complete = self._paginate(
+            puuid, region, start_time, end_time, queue, match_type
+        )
 
-        matches = []
-        for i, match_id in enumerate(match_ids):
-            match_data = self.get_match_details(match_id, region)
-            if match_data:
-                matches.append(match_data)
+        if store and closed and complete:
+            store.put_month_ids(puuid, key, match_ids)
+        return match_ids, complete
+
+    def get_match_ids_since(
+        self,
+        puuid,
+        region="europe",
+        start_time=None,
+        queue=None,
+        match_type=None,
+        return_complete=False,
+    ):
+        # Oldest first, like get_year_match_history
+        match_ids, complete = self._paginate(
+            puuid, region, start_time, None, queue, match_type
+        )
+        match_ids = list(reversed(match_ids))
+
+        if return_complete:
+            return match_ids, complete
+        return match_ids
+
+    @staticmethod
+    def filter_key(queue=None, match_type=None):
+        # Suffix for stored ID lists: a ranked-only listing is not the full one
+        key = ""
+        if queue is not None:
+            key += f":queue={queue}"
+        if match_type:
+            key += f":type={match_type}"
+        return key
+
+    def _merge_month_ids(self, month_matches):
+        # Riot lists each window newest first: flip to oldest first, January to
+        # December, and drop IDs that show up in two windows at a month boundary
+        seen = set()
+        merged = []
+        for matches in month_matches:
+            for match_id in reversed(matches):
+                if match_id not in seen:
+                    seen.add(match_id)
+                    merged.append(match_id)
+        return merged
+
+    def get_bulk_match_details(
+        self, match_ids, region="europe", workers=1, return_failed=False
+    ):
+        print(f"Fetching details for {len(match_ids)} matches...")
 
-            if (i + 1) % 10 == 0:
-                print(f"  Progress: {i + 1}/{len(match_ids)}")
+        matches, failed = self._fetch_bulk(
+            self._download_match,
+            match_ids,
+            region,
+            workers,
+            cached=self._cache_get_many("match", match_ids),
+        )
+        matches = list(matches.values())
 
         print(f"Loaded {len(matches)} match details")
+        if failed:
+            print(f"Failed to load {len(failed)} matches")
+
+        if return_failed:
+            return matches, failed
         return matches
 
-    def _fetch_matches_with_pagination(self, puuid, region, start_time, end_time):
+    def get_bulk_match_timelines(
+        self,
+        match_ids,
+        region="europe",
+        workers=1,
+        return_failed=False,
+        compact=False,
+        keyed=False,
+    ):
+        # keyed: {match_id: timeline} instead of a list, failures leave no hole to misalign
+        timelines, failed = self._fetch_bulk(
+            lambda match_id, region: self._download_timeline(match_id, region, compact),
+            match_ids,
+            region,
+            workers,
+            cached=self._cached_timelines(match_ids, compact),
+        )
+        if not keyed:
+            timelines = list(timelines.values())
+
+        if failed:
+            print(f"Failed to load {len(failed)} timelines")
+
+        if return_failed:
+            return timelines, failed
+        return timelines
+
+    def _fetch_bulk(self, fetch, match_ids, region, workers=1, cached=None):
+        # cached: the bulk cache lookup done up front, fetch only downloads the misses
+        cached = cached or {}
+        missing = [match_id for match_id in match_ids if match_id not in cached]
+
+        if cached:
+            print(f"  {len(cached)} from cache, {len(missing)} to download")
+
+        # Results stay in match_ids order whatever order the workers finish in
+        if workers > 1:
+            pool = ThreadPoolExecutor(max_workers=workers)
+            results = pool.map(lambda match_id: fetch(match_id, region), missing)
+        else:
+            pool = None
+            results = (fetch(match_id, region) for match_id in missing)
+
+        downloaded = {}
+        try:
+            for i, (match_id, data) in enumerate(zip(missing, results)):
+                downloaded[match_id] = data
+
+                if (i + 1) % 10 == 0:
+                    print(f"  Progress: {i + 1}/{len(missing)}")
+        finally:
+            if pool:
+                pool.shutdown(wait=True)
+
+        fetched = {}
+        failed = []
+        for match_id in match_ids:
+            data = cached.get(match_id) or downloaded.get(match_id)
+            if data:
+                fetched[match_id] = data
+            else:
+                failed.append(match_id)
+
+        return fetched, failed
+
+    def _paginate(
+        self, puuid, region, start_time, end_time, queue=None, match_type=None
+    ):
+        # complete is False when a page failed, so a partial list is never cached
         all_matches = []
         start_index = 0
         batch_size = 100
@@ -85,9 +318,14 @@ class Match(Core):
                 start=start_index,
                 start_time=start_time,
                 end_time=end_time,
+                queue=queue,
+                match_type=match_type,
             )
 
-            if not batch or len(batch) == 0:
+            if batch is None:
+                return all_matches, False
+
+            if len(batch) == 0:
                 break
 
             all_matches.extend(batch)
@@ -96,9 +334,8 @@ class Match(Core):
                 break
 
             start_index += batch_size
-            time.sleep(0.1)
 
-        return all_matches
+        return all_matches, True
 
     def _get_month_timestamps(self, year, month):
         start_date = datetime(year, month, 1)
@@ -574,3 +811,190 @@ class Match(Core):
         self.aggregated_stats["strengths"] = strengths
 
         return weaknesses, strengths
+
+
+class AsyncMatch(AsyncCore, Match):
+    async def get_match_details(self, match_id, region="europe"):
+        cached = await self._run_blocking(self._cache_get, "match", match_id)
+        if cached:
+            return cached
+
+        url = self._build_region_url(region, f"/lol/match/v5/matches/{match_id}")
+        data = await self._make_request(url, method="match-v5.getMatch")
+        await self._run_blocking(self._cache_put, "match", match_id, data)
+        return data
+
+    async def get_match_timeline(self, match_id, region="europe", compact=False):
+        cached = await self._run_blocking(self._cached_timeline, match_id, compact)
+        if cached:
+            return cached
+
+        url = self._build_region_url(
+            region, f"/lol/match/v5/matches/{match_id}/timeline"
+        )
+        data = await self._make_request(
+            url,
+            method="match-v5.getTimeline",
+            parser=parse_timeline_stream if compact else None,
+        )
+        await self._run_blocking(
+            self._cache_put, self._timeline_kind(compact), match_id, data
+        )
+        return data
+
+    async def get_year_match_history(
+        self,
+        puuid,
+        region="europe",
+        year=2024,
+        workers=None,
+        *,
+        queue=None,
+        match_type=None,
+        return_complete=False,
+    ):
+        # Match's arguments: workers is accepted, months are paged side by side on
+        # the loop and capped by the client's max_in_flight
+        print(f"Fetching all matches for {year}...")
+
+        months = await asyncio.gather(
+            *(
+                self._fetch_month_ids(
+                    puuid,
+                    region,
+                    year,
+                    month,
+                    *self._get_month_timestamps(year, month),
+                    queue,
+                    match_type,
+                )
+                for month in range(1, 13)
+            )
+        )
+
+        all_match_ids = self._merge_month_ids(matches for matches, _ in months)
+        print(f"Total: {len(all_match_ids)} matches")
+
+        if return_complete:
+            return all_match_ids, all(complete for _, complete in months)
+        return all_match_ids
+
+    async def _fetch_month_ids(
+        self, puuid, region, year, month, start_time, end_time, queue=None, match_type=None
+    ):
+        # Same closed-month ID lists as Match, read and written off the event loop
+        store = self.client.sync_store
+        closed = end_time + self.MONTH_GRACE <= time.time()
+        key = f"{year}-{month:02d}{self.filter_key(queue, match_type)}"
+
+        if store and closed:
+            cached = await self._run_blocking(store.get_month_ids, puuid, key)
+            if cached is not None:
+                return cached, True
+
+        match_ids, complete = await self._paginate(
+            puuid, region, start_time, end_time, queue, match_type
+        )
+
+        if store and closed and complete:
+            await self._run_blocking(store.put_month_ids, puuid, key, match_ids)
+        return match_ids, complete
+
+    async def get_match_ids_since(
+        self,
+        puuid,
+        region="europe",
+        start_time=None,
+        queue=None,
+        match_type=None,
+        return_complete=False,
+    ):
+        match_ids, complete = await self._paginate(
+            puuid, region, start_time, None, queue, match_type
+        )
+        match_ids = list(reversed(match_ids))
+
+        if return_complete:
+            return match_ids, complete
+        return match_ids
+
+    async def get_bulk_match_details(
+        self, match_ids, region="europe", return_failed=False
+    ):
+        print(f"Fetching details for {len(match_ids)} matches...")
+
+        matches, failed = await self._fetch_bulk(
+            self.get_match_details, match_ids, region
+        )
+        matches = list(matches.values())
+
+        print(f"Loaded {len(matches)} match details")
+        if failed:
+            print(f"Failed to load {len(failed)} matches")
+
+        if return_failed:
+            return matches, failed
+        return matches
+
+    async def get_bulk_match_timelines(
+        self, match_ids, region="europe", return_failed=False, compact=False, keyed=False
+    ):
+        timelines, failed = await self._fetch_bulk(
+            lambda match_id, region: self.get_match_timeline(match_id, region, compact),
+            match_ids,
+            region,
+        )
+        if not keyed:
+            timelines = list(timelines.values())
+
+        if failed:
+            print(f"Failed to load {len(failed)} timelines")
+
+        if return_failed:
+            return timelines, failed
+        return timelines
+
+    async def _fetch_bulk(self, fetch, match_ids, region):
+        results = await asyncio.gather(
+            *(fetch(match_id, region) for match_id in match_ids)
+        )
+
+        fetched = {
+            match_id: data for match_id, data in zip(match_ids, results) if data
+        }
+        failed = [match_id for match_id, data in zip(match_ids, results) if not data]
+        return fetched, failed
+
+    async def _paginate(
+        self, puuid, region, start_time, end_time, queue=None, match_type=None
+    ):
+        all_matches = []
+        start_index = 0
+        batch_size = 100
+
+        while True:
+            batch = await self.get_match_history(
+                puuid=puuid,
+                region=region,
+                count=batch_size,
+                start=start_index,
+                start_time=start_time,
+                end_time=end_time,
+                queue=queue,
+                match_type=match_type,
+            )
+
+            if batch is None:
+                return all_matches, False
+
+            if len(batch) == 0:
+                break
+
+            all_matches.extend(batch)
+
+            if len(batch) < batch_size:
+                break
+
+            start_index += batch_size
+
+        return all_matches, True
@@ -1,8 +1,13 @@
-from ..Core import Core
+from ..Core import Core, AsyncCore
 
 
 class Rank(Core):
     def get_rank_info(self, identifier, platform="euw1", by_puuid=True):
         endpoint = "by-puuid" if by_puuid else "by-summoner"
         url = self._build_server_url(platform, f"/lol/league/v4/entries/{endpoint}/{identifier}")
-        return self._make_request(url)
+        method = "league-v4.getLeagueEntriesByPUUID" if by_puuid else "league-v4.getLeagueEntriesForSummoner"
+        return self._make_request(url, method=method)
+
+
+class AsyncRank(AsyncCore, Rank):
+    pass
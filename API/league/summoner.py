@@ -1,7 +1,11 @@
-from ..Core import Core
+from ..Core import Core, AsyncCore
 
 
 class Summoner(Core):
     def get_summoner_infos(self, puuid, platform="euw1"):
         url = self._build_server_url(platform, f"/lol/summoner/v4/summoners/by-puuid/{puuid}")
-        return self._make_request(url)
+        return self._make_request(url, method="summoner-v4.getByPUUID")
+
+
+class AsyncSummoner(AsyncCore, Summoner):
+    pass
@@ -0,0 +1,120 @@
+import codecs
+import json
+
+
+# Everything Player._extract_timeline_stats reads from a timeline
+PARTICIPANT_FRAME_FIELDS = (
+    "minionsKilled",
+    "jungleMinionsKilled",
+    "totalGold",
+    "xp",
+    "level",
+)
+EVENT_FIELDS = ("type", "timestamp", "victimId", "killerId", "position")
+EVENT_TYPES = ("CHAMPION_KILL",)
+
+
+def compact_frame(frame):
+    return {
+        "timestamp": frame["timestamp"],
+        "participantFrames": {
+            participant_id: {
+                field: participant_frame.get(field, 0)
+                for field in PARTICIPANT_FRAME_FIELDS
+            }
+            for participant_id, participant_frame in frame.get(
+                "participantFrames", {}
+            ).items()
+        },
+        "events": [
+            {field: event[field] for field in EVENT_FIELDS if field in event}
+            for event in frame.get("events", [])
+            if event.get("type") in EVENT_TYPES
+        ],
+    }
+
+
+def compact_timeline(timeline):
+    # Same shape as a match-v5 timeline, minus everything the analysis never reads
+    if not timeline:
+        return timeline
+
+    frames = timeline.get("info", {}).get("frames", [])
+    return {"info": {"frames": [compact_frame(frame) for frame in frames]}}
+
+
+class TimelineStreamParser:
+    # Feed the raw body chunk by chunk: each frame is decoded on its own, projected
+    # with compact_frame and dropped, so the full timeline tree never exists in memory.
+    def __init__(self):
+        self.decoder = json.JSONDecoder()
+        self.text = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.state = "seek"
+        self.frames = []
+
+    def feed(self, chunk):
+        self.buffer += self.text.decode(chunk)
+
+        if self.state == "seek":
+            self._seek_frames()
+        if self.state == "frames":
+            self._read_frames()
+
+    def _seek_frames(self):
+        key = self.buffer.find('"frames"')
+        if key == -1:
+            # Keep a tail in case the key is split across two chunks
+            self.buffer = self.buffer[-16:]
+            return
+
+        start = self.buffer.find("[", key)
+        if start == -1:
+            self.buffer = self.buffer[key:]
+            return
+
+        self.buffer = self.buffer[start + 1 :]
+        self.state = "frames"
+
+    def _read_frames(self):
+        pos = 0
+        buffer = self.buffer
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+
+            if pos == len(buffer):
+                break
+
+            if buffer[pos] == "]":
+                self.state = "done"
+                pos = len(buffer)
+                break
+
+            try:
+                frame, pos = self.decoder.raw_decode(buffer, pos)
+            except ValueError:
+                # Frame not fully received yet
+                break
+
+            self.frames.append(compact_frame(frame))
+
+        self.buffer = buffer[pos:]
+
+    def close(self):
+        self.buffer += self.text.decode(b"", final=True)
+        if self.state == "frames":
+            self._read_frames()
+
+        if self.state != "done":
+            raise ValueError("Truncated timeline: frames array never closed")
+
+        return {"info": {"frames": self.frames}}
+
+
+def parse_timeline_stream(response, chunk_size=64 * 1024):
+    parser = TimelineStreamParser()
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        parser.feed(chunk)
+    return parser.close()
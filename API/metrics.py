@@ -0,0 +1,168 @@
+import threading
+import time
+
+
+class Histogram:
+    # Upper bounds in seconds, Prometheus style (cumulative when exported)
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else None,
+            "buckets": {str(bound): count for bound, count in self.cumulative()},
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.latency = {}
+        self.bytes_received = {}
+        self.status_codes = {}
+        self.retries = {}
+        self.rate_limit_wait = {}
+
+    def observe_request(self, endpoint, status_code, seconds, size):
+        endpoint = endpoint or "unknown"
+        with self.lock:
+            if endpoint not in self.latency:
+                self.latency[endpoint] = Histogram()
+            self.latency[endpoint].observe(seconds)
+
+            self.bytes_received[endpoint] = self.bytes_received.get(endpoint, 0) + size
+
+            key = (endpoint, status_code)
+            self.status_codes[key] = self.status_codes.get(key, 0) + 1
+
+    def observe_retry(self, endpoint, reason):
+        key = (endpoint or "unknown", reason)
+        with self.lock:
+            self.retries[key] = self.retries.get(key, 0) + 1
+
+    def observe_rate_limit_wait(self, host, seconds):
+        if seconds <= 0:
+            return
+        with self.lock:
+            self.rate_limit_wait[host] = self.rate_limit_wait.get(host, 0) + seconds
+
+    def snapshot(self):
+        with self.lock:
+            elapsed = time.monotonic() - self.started
+            total_requests = sum(h.count for h in self.latency.values())
+            total_bytes = sum(self.bytes_received.values())
+            network_time = sum(h.sum for h in self.latency.values())
+            wait_time = sum(self.rate_limit_wait.values())
+
+            return {
+                "elapsed_seconds": round(elapsed, 3),
+                "total_requests": total_requests,
+                "requests_per_second": round(total_requests / elapsed, 3)
+                if elapsed
+                else 0,
+                "total_bytes": total_bytes,
+                "bytes_per_second": round(total_bytes / elapsed, 1) if elapsed else 0,
+                # Network-bound runs pile up request time, budget-bound ones wait time
+                "total_request_seconds": round(network_time, 3),
+                "total_rate_limit_wait_seconds": round(wait_time, 3),
+                "endpoints": {
+                    endpoint: {
+                        "latency": histogram.snapshot(),
+                        "bytes": self.bytes_received.get(endpoint, 0),
+                        "status_codes": {
+                            status: count
+                            for (name, status), count in self.status_codes.items()
+                            if name == endpoint
+                        },
+                        "retries": {
+                            reason: count
+                            for (name, reason), count in self.retries.items()
+                            if name == endpoint
+                        },
+                    }
+                    for endpoint, histogram in self.latency.items()
+                },
+                "retries": {
+                    f"{endpoint}:{reason}": count
+                    for (endpoint, reason), count in self.retries.items()
+                },
+                "rate_limit_wait_seconds": {
+                    host: round(seconds, 3)
+                    for host, seconds in self.rate_limit_wait.items()
+                },
+            }
+
+    def to_prometheus(self):
+        lines = []
+
+        with self.lock:
+            lines.append(
+                "# HELP riot_request_duration_seconds Riot API request latency"
+            )
+            lines.append("# TYPE riot_request_duration_seconds histogram")
+            for endpoint, histogram in sorted(self.latency.items()):
+                for bound, count in histogram.cumulative():
+                    lines.append(
+                        f'riot_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {count}'
+                    )
+                lines.append(
+                    f'riot_request_duration_seconds_bucket{{endpoint="{endpoint}",le="+Inf"}} {histogram.count}'
+                )
+                lines.append(
+                    f'riot_request_duration_seconds_sum{{endpoint="{endpoint}"}} {histogram.sum}'
+                )
+                lines.append(
+                    f'riot_request_duration_seconds_count{{endpoint="{endpoint}"}} {histogram.count}'
+                )
+
+            lines.append("# HELP riot_response_bytes_total Response body bytes received")
+            lines.append("# TYPE riot_response_bytes_total counter")
+            for endpoint, size in sorted(self.bytes_received.items()):
+                lines.append(f'riot_response_bytes_total{{endpoint="{endpoint}"}} {size}')
+
+            lines.append("# HELP riot_responses_total Responses by status code")
+            lines.append("# TYPE riot_responses_total counter")
+            for (endpoint, status), count in sorted(self.status_codes.items()):
+                lines.append(
+                    f'riot_responses_total{{endpoint="{endpoint}",status="{status}"}} {count}'
+                )
+
+            lines.append("# HELP riot_retries_total Retried requests by reason")
+            lines.append("# TYPE riot_retries_total counter")
+            for (endpoint, reason), count in sorted(self.retries.items()):
+                lines.append(
+                    f'riot_retries_total{{endpoint="{endpoint}",reason="{reason}"}} {count}'
+                )
+
+            lines.append(
+                "# HELP riot_rate_limit_wait_seconds_total Time spent waiting for rate limits"
+            )
+            lines.append("# TYPE riot_rate_limit_wait_seconds_total counter")
+            for host, seconds in sorted(self.rate_limit_wait.items()):
+                lines.append(
+                    f'riot_rate_limit_wait_seconds_total{{host="{host}"}} {seconds}'
+                )
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,225 @@
+from API.models.stats import AVERAGED_FIELDS, DEATH_PERIODS
+from array import array
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:
+    # Optional: without it Player aggregates row by row, same output
+    np = None
+
+
+# Per-match numbers read by the aggregates, missing timeline fields become 0.
+# Values are array.array type codes: appends stay cheap and numpy reads the
+# buffer in one memcpy, without converting Python objects
+NUMERIC_FIELDS = {
+    "win": "b",
+    "kills": "q",
+    "deaths": "q",
+    "assists": "q",
+    "kda": "d",
+    "cs_per_min": "d",
+    "vision_score": "q",
+    "wards_placed": "q",
+    "control_wards_placed": "q",
+    "damage_per_min": "d",
+    "game_creation": "q",
+    "cs_at_10": "q",
+    "gold_at_10": "q",
+}
+
+DTYPES = {"b": "int8", "q": "int64", "d": "float64"}
+
+
+class Categories:
+    # Values -> int codes in order of first appearance, like the dicts they replace
+    def __init__(self):
+        self.labels = []
+        self.index = {}
+        self._codes = array("q")
+
+    def add(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.labels)
+            self.labels.append(value)
+        self._codes.append(code)
+
+    @property
+    def codes(self):
+        # A copy: a live view would stop the array.array from growing (BufferError)
+        return np.frombuffer(self._codes, dtype="int64").copy()
+
+    def counts(self, weights=None):
+        return np.bincount(self.codes, weights=weights, minlength=len(self.labels))
+
+
+class MatchColumns:
+    # One typed array per stat instead of one dict per match. Filled match by
+    # match next to extraction, so aggregating is only array reductions
+    def __init__(self, processed_stats=()):
+        self.match_ids = set()
+        self.size = 0
+        self._values = {
+            field: array(typecode) for field, typecode in NUMERIC_FIELDS.items()
+        }
+        self._deaths = {period: array("q") for period in DEATH_PERIODS}
+
+        self.role = Categories()
+        self.champion = Categories()
+        self.champion_names = {}
+        # Not numbers: kept as per-match lists for death_analysis
+        self.death_events = []
+
+        self.extend(processed_stats)
+
+    def append(self, stat):
+        match_id = stat.get("match_id")
+        if match_id is not None:
+            if match_id in self.match_ids:
+                return False
+            self.match_ids.add(match_id)
+
+        for field, values in self._values.items():
+            values.append(stat.get(field, 0))
+
+        death_timing = stat.get("death_timing", {})
+        for period, values in self._deaths.items():
+            values.append(death_timing.get(period, 0))
+
+        self.role.add(stat["role"])
+        self.champion.add(stat["champion_id"])
+        self.champion_names.setdefault(stat["champion_id"], stat["champion_name"])
+        if "death_events" in stat:
+            self.death_events.append(stat["death_events"])
+
+        self.size += 1
+        return True
+
+    def extend(self, stats):
+        for stat in stats:
+            self.append(stat)
+        return self
+
+    def __len__(self):
+        return self.size
+
+    def __getattr__(self, field):
+        # columns.kills, columns.kda, ...: snapshots, appending stays possible while
+        # a caller holds one (a view over the array.array would block resizing)
+        if field not in NUMERIC_FIELDS:
+            raise AttributeError(field)
+        return np.frombuffer(
+            self._values[field], dtype=DTYPES[NUMERIC_FIELDS[field]]
+        ).copy()
+
+    def deaths_in(self, period):
+        return np.frombuffer(self._deaths[period], dtype="int64").copy()
+
+    def month_codes(self):
+        # Local-time month boundaries + searchsorted, no datetime per match
+        if not self.size:
+            return [], np.array([], dtype="int64")
+
+        creation = self.game_creation
+        first = datetime.fromtimestamp(creation.min() / 1000)
+        last = datetime.fromtimestamp(creation.max() / 1000)
+
+        labels = []
+        starts = []
+        year, month = first.year, first.month
+        while (year, month) <= (last.year, last.month):
+            labels.append(f"{year}-{month:02d}")
+            starts.append(datetime(year, month, 1).timestamp() * 1000)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        codes = np.searchsorted(np.array(starts), creation, side="right") - 1
+        return labels, codes
+
+    def role_stats(self, role):
+        code = self.role.index.get(role)
+        if code is None:
+            return None
+
+        mask = self.role.codes == code
+        total = int(mask.sum())
+
+        return {
+            "role": role,
+            "games": total,
+            "win_rate": int(self.win[mask].sum()) / total,
+            "avg_kda": float(self.kda[mask].sum()) / total,
+            "avg_cs_per_min": float(self.cs_per_min[mask].sum()) / total,
+            "avg_vision_score": int(self.vision_score[mask].sum()) / total,
+            "avg_damage_per_min": float(self.damage_per_min[mask].sum()) / total,
+        }
+
+    def mean(self, column, mask=None):
+        values = column if mask is None else column[mask]
+        return float(values.mean()) if len(values) else None
+
+    def summary(self):
+        total_games = self.size
+
+        role_counts = {
+            role: int(count)
+            for role, count in zip(self.role.labels, self.role.counts())
+        }
+
+        champion = self.champion
+        games = champion.counts()
+        wins = champion.counts(self.win)
+        total_kda = champion.counts(self.kda)
+        total_cs_per_min = champion.counts(self.cs_per_min)
+        champion_performance = [
+            {
+                "champion_id": champ_id,
+                "champion_name": self.champion_names[champ_id],
+                "games": int(games[code]),
+                "win_rate": float(wins[code] / games[code]),
+                "avg_kda": round(float(total_kda[code] / games[code]), 2),
+                "avg_cs_per_min": round(float(total_cs_per_min[code] / games[code]), 2),
+            }
+            for code, champ_id in enumerate(champion.labels)
+        ]
+        champion_performance.sort(key=lambda x: x["games"], reverse=True)
+
+        with_cs10 = self.cs_at_10 > 0
+
+        month_labels, month_codes = self.month_codes()
+        month_games = np.bincount(month_codes, minlength=len(month_labels))
+        month_wins = np.bincount(month_codes, weights=self.win, minlength=len(month_labels))
+        month_kda = np.bincount(month_codes, weights=self.kda, minlength=len(month_labels))
+        monthly_performance = {}
+        for code, month_key in enumerate(month_labels):
+            if not month_games[code]:
+                continue
+            monthly_performance[month_key] = {
+                "games": int(month_games[code]),
+                "wins": int(month_wins[code]),
+                "total_kda": float(month_kda[code]),
+                "win_rate": round(float(month_wins[code] / month_games[code]), 2),
+                "avg_kda": round(float(month_kda[code] / month_games[code]), 2),
+            }
+
+        return {
+            "total_games": total_games,
+            "role_counts": role_counts,
+            "wins": int(self.win.sum()),
+            "averages": {
+                field: float(getattr(self, field).sum()) / total_games
+                for field in AVERAGED_FIELDS
+            },
+            "total_deaths": int(self.deaths.sum()),
+            "champion_performance": champion_performance,
+            "avg_cs_at_10": self.mean(self.cs_at_10, with_cs10),
+            "avg_gold_at_10": self.mean(self.gold_at_10, with_cs10),
+            "death_timing": {
+                period: int(self.deaths_in(period).sum())
+                for period in DEATH_PERIODS
+            },
+            "death_events": [
+                event for events in self.death_events for event in events
+            ],
+            "monthly_performance": monthly_performance,
+        }
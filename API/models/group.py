@@ -0,0 +1,94 @@
+from API.client import RiotClient
+from API.models.player import Player, load_players
+import threading
+
+
+class MatchStore:
+    # Match payloads downloaded once and indexed by every participant PUUID,
+    # so a game counts for each tracked player who played in it
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.matches = {}
+        self.timelines = {}
+        self.by_puuid = {}
+
+    def add(self, match):
+        match_id = match["metadata"]["matchId"]
+        with self.lock:
+            if match_id in self.matches:
+                return
+            self.matches[match_id] = match
+            for puuid in match["metadata"]["participants"]:
+                self.by_puuid.setdefault(puuid, []).append(match_id)
+
+    def get(self, match_id):
+        return self.matches.get(match_id)
+
+    def matches_for(self, puuid):
+        # Oldest first, like match_history
+        with self.lock:
+            matches = [self.matches[match_id] for match_id in self.by_puuid.get(puuid, [])]
+        return sorted(matches, key=lambda match: match["info"]["gameCreation"])
+
+    def add_timeline(self, match_id, timeline):
+        with self.lock:
+            self.timelines[match_id] = timeline
+
+    def get_timeline(self, match_id):
+        return self.timelines.get(match_id)
+
+    def __contains__(self, match_id):
+        return match_id in self.matches
+
+    def __len__(self):
+        return len(self.matches)
+
+
+class PlayerGroup:
+    # A team, a club, a ladder slice: one client and one MatchStore for everyone
+    def __init__(self, riot_ids, region="europe", platform="euw1", client=None):
+        self.client = client or RiotClient.default()
+        self.store = MatchStore()
+        self.players = [
+            Player(
+                game_name,
+                tag_line,
+                region,
+                platform,
+                client=self.client,
+                store=self.store,
+            )
+            for game_name, tag_line in riot_ids
+        ]
+
+    def load(
+        self, year=2024, with_timelines=False, workers=1, queue=None, match_type=None
+    ):
+        load_players(self.players, year, queue, match_type)
+        players = [player for player in self.players if player.puuid]
+
+        listed = sum(len(player.match_history) for player in players)
+        for player in players:
+            player.load_match_details(workers=workers)
+
+        # Matches downloaded for later players also count for the earlier ones
+        for player in players:
+            player.load_shared_matches()
+
+        print(
+            f"{len(self.store)} unique matches for {len(players)} players"
+            f" ({listed} listed)"
+        )
+
+        if with_timelines:
+            for player in players:
+                player.load_match_timelines(workers=workers)
+
+        return self.players
+
+    def process_matches(self):
+        return {
+            f"{player.game_name}#{player.tag_line}": player.process_matches()
+            for player in self.players
+            if player.matches
+        }
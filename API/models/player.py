@@ -1,40 +1,142 @@
-from API.riot.account import RiotAccountAPI
-from API.league.summoner import Summoner
-from API.league.rank import Rank
-from API.league.match import Match
-from API.league.mastery import ChampionMastery
+from API.riot.account import RiotAccountAPI, AsyncRiotAccountAPI
+from API.league.summoner import Summoner, AsyncSummoner
+from API.league.rank import Rank, AsyncRank
+from API.league.match import Match, AsyncMatch
+from API.league.mastery import ChampionMastery, AsyncChampionMastery
+from API.cache import MatchCache
+from API.client import RiotClient
+from API.models.columns import MatchColumns, np
+from API.models.stats import StatsAccumulator, merge_aggregates
+from API.scheduler import PROFILE, RECENT_DETAILS, TIMELINES, HISTORY
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+import asyncio
+import multiprocessing
+import threading
+
+
+# Matches per task sent to an extraction process
+EXTRACT_CHUNK_SIZE = 256
+
+# Extraction process state, set once by _init_extract_worker
+_extract_worker = {}
+
+# A match the worker could not read from the cache, the parent extracts it
+_NOT_CACHED = "not-cached"
+
+
+def load_players(players, year=2024, queue=None, match_type=None):
+    # One crawler per region so every regional budget is spent at the same time
+    by_region = {}
+    for player in players:
+        by_region.setdefault(player.region, []).append(player)
+
+    def crawl(region_players):
+        return [player.load(year, queue, match_type) for player in region_players]
+
+    with ThreadPoolExecutor(max_workers=len(by_region) or 1) as pool:
+        list(pool.map(crawl, by_region.values()))
+
+    return players
+
+
+def _init_extract_worker(puuid, cache_path):
+    # Extraction only needs the PUUID: an offline client, no key, no cache
+    player = Player("", "", client=RiotClient(api_key="extract-worker", cache_path=None))
+    player.puuid = puuid
+    _extract_worker["player"] = player
+    _extract_worker["cache"] = MatchCache(cache_path)
+
+
+def _extract_chunk(match_ids, timeline_ids):
+    # One row per match ID: stats, None (player not in the match) or _NOT_CACHED
+    player = _extract_worker["player"]
+    cache = _extract_worker["cache"]
+
+    matches = cache.get_many("match", match_ids)
+    timelines = cache.get_many("timeline_compact", timeline_ids)
+    full = [match_id for match_id in timeline_ids if match_id not in timelines]
+    if full:
+        timelines.update(cache.get_many("timeline", full))
+
+    rows = []
+    for match_id in match_ids:
+        match = matches.get(match_id)
+        if match is None or (match_id in timeline_ids and match_id not in timelines):
+            rows.append(_NOT_CACHED)
+            continue
+        rows.append(player._extract_stats(match, timelines.get(match_id)))
+    return rows
 
 
 class Player:
-    def __init__(self, game_name, tag_line, region="europe", platform="euw1"):
+    # Ranked solo / flex, for timeline_queues=Player.RANKED_QUEUES
+    RANKED_QUEUES = (420, 440)
+
+    ACCOUNT_API = RiotAccountAPI
+    SUMMONER_API = Summoner
+    RANK_API = Rank
+    MATCH_API = Match
+    MASTERY_API = ChampionMastery
+
+    def __init__(
+        self,
+        game_name,
+        tag_line,
+        region="europe",
+        platform="euw1",
+        client=None,
+        store=None,
+    ):
         self.game_name = game_name
         self.tag_line = tag_line
         self.region = region
         self.platform = platform
 
-        self._account_api = RiotAccountAPI()
-        self._summoner_api = Summoner()
-        self._rank_api = Rank()
-        self._match_api = Match()
-        self._mastery_api = ChampionMastery()
+        # One client (api key, pooled session, rate limit state) for every endpoint,
+        # shared with every other Player built without one
+        self.client = client or RiotClient.default()
+
+        self._account_api = self.ACCOUNT_API(self.client)
+        self._summoner_api = self.SUMMONER_API(self.client)
+        self._rank_api = self.RANK_API(self.client)
+        self._match_api = self.MATCH_API(self.client)
+        self._mastery_api = self.MASTERY_API(self.client)
+
+        # Optional MatchStore shared with other players (see models/group.py)
+        self.store = store
 
         self.puuid = None
         self.summoner_info = None
         self.rank_info = None
         self.match_history = []
         self.matches = []
+        # match_id -> timeline, filled on demand: not every match needs one
+        self.timelines = {}
+        self.failed_match_ids = []
+        self.failed_timeline_ids = []
+        # Set by aggregate_shards: IDs dropped from a shard, already in an earlier one
+        self.duplicate_match_ids = []
         self.champion_mastery = None
+        self.aggregated_stats = None
+        # MatchColumns or StatsAccumulator behind aggregated_stats
+        self.aggregate = None
 
-    def load_recent_matches(self, count=100):
+        # Filled by load_prioritized's workers, read by collect_loaded
+        self._loaded_lock = threading.Lock()
+        self._loaded_matches = {}
+        self._loaded_timelines = {}
+
+    def load_recent_matches(self, count=100, workers=1, queue=None, match_type=None):
+        # queue / match_type are applied by Riot: e.g. queue=420 for ranked solo only
         print(f"\nLoading {count} most recent matches...")
         self.match_history = self._match_api.get_match_history(
-            self.puuid, self.region, count=count
+            self.puuid, self.region, count=count, queue=queue, match_type=match_type
         )
         print(f"Found {len(self.match_history)} matches")
         print(f"Fetching match details...")
-        self.matches = self._match_api.get_bulk_match_details(
-            self.match_history, self.region
-        )
+        self.load_match_details(workers=workers)
         print(f"Loaded {len(self.matches)} complete matches\n")
         return self.matches
 
@@ -48,29 +150,334 @@ class Player:
             print("Failed to get PUUID")
             return False
 
-        self.summoner_info = self._summoner_api.get_summoner_infos(
-            self.puuid, self.platform
+        self._collect_profile(self._submit_profile_calls())
+
+        print(f"Profile loaded")
+        return True
+
+    def _submit_profile_calls(self):
+        # Platform calls (euw1, ...) run in their own lane, next to regional ones
+        return (
+            self.client.submit(
+                self.platform,
+                self._summoner_api.get_summoner_infos,
+                self.puuid,
+                self.platform,
+            ),
+            self.client.submit(
+                self.platform,
+                self._rank_api.get_rank_info,
+                self.puuid,
+                self.platform,
+                by_puuid=True,
+            ),
+            self.client.submit(
+                self.platform,
+                self._mastery_api.get_top_masteries,
+                self.puuid,
+                self.platform,
+                count=5,
+            ),
         )
-        self.rank_info = self._rank_api.get_rank_info(
-            self.puuid, self.platform, by_puuid=True
+
+    def _collect_profile(self, futures):
+        summoner, rank, mastery = futures
+        self.summoner_info = summoner.result()
+        self.rank_info = rank.result()
+        self.champion_mastery = mastery.result()
+
+    def load(self, year=2024, queue=None, match_type=None):
+        print(f"Loading profile and {year} matches: {self.game_name}#{self.tag_line}")
+
+        self.puuid = self._account_api.get_puuid(
+            self.game_name, self.tag_line, self.region
         )
-        self.champion_mastery = self._mastery_api.get_top_masteries(
-            self.puuid, self.platform, count=5
+        if not self.puuid:
+            print("Failed to get PUUID")
+            return False
+
+        profile = self._submit_profile_calls()
+        history = self.client.submit(
+            self.region, self.load_year_matches, year, queue, match_type
         )
 
-        print(f"Profile loaded")
+        self._collect_profile(profile)
+        history.result()
         return True
 
-    def load_year_matches(self, year=2024):
+    def load_year_matches(self, year=2024, queue=None, match_type=None):
         self.match_history = self._match_api.get_year_match_history(
-            self.puuid, self.region, year
+            self.puuid, self.region, year, queue=queue, match_type=match_type
         )
         return self.match_history
 
-    def load_match_details(self):
-        self.matches = self._match_api.get_bulk_match_details(
-            self.match_history, self.region
+    def download_year(
+        self,
+        year=2024,
+        with_timelines=False,
+        workers=1,
+        compact=True,
+        queue=None,
+        match_type=None,
+    ):
+        # Crash-safe bulk load: the ID list is journaled before the first detail call
+        # and every payload is committed to the match cache as it arrives, so a rerun
+        # after a crash or Ctrl-C only downloads what is still missing
+        store = self.client.sync_store
+        cache = self.client.match_cache
+        job = f"{self.puuid}:{year}{self._match_api.filter_key(queue, match_type)}"
+        match_ids = store.get_job(job) if store else None
+
+        if match_ids is None:
+            self.load_year_matches(year, queue, match_type)
+            if store:
+                store.put_job(job, self.match_history)
+        else:
+            self.match_history = match_ids
+            left = len(cache.missing("match", match_ids)) if cache else len(match_ids)
+            print(
+                f"Resuming {year} download: {len(match_ids) - left}/{len(match_ids)}"
+                f" matches already saved"
+            )
+
+        self.load_match_details(workers=workers)
+        if with_timelines:
+            self.load_match_timelines(workers=workers, compact=compact)
+
+        # Every ID was tried: failures are retried by the next run, which lists again
+        if store:
+            store.delete_job(job)
+        return self.matches
+
+    def load_prioritized(
+        self,
+        year=2024,
+        recent=20,
+        with_timelines=True,
+        recent_deadline=None,
+        queue=None,
+        match_type=None,
+    ):
+        # Profile first, then the most recent details, then their timelines, then the
+        # rest of the year. Returns the futures per stage: call collect_loaded() at any
+        # point to analyze whatever has arrived so far.
+        scheduler = self.client.scheduler
+        with self._loaded_lock:
+            self._loaded_matches = {}
+            self._loaded_timelines = {}
+
+        self.puuid = self._account_api.get_puuid(
+            self.game_name, self.tag_line, self.region
+        )
+        if not self.puuid:
+            print("Failed to get PUUID")
+            return None
+
+        futures = {
+            "profile": [
+                scheduler.submit(
+                    PROFILE,
+                    self._load_into,
+                    "summoner_info",
+                    self._summoner_api.get_summoner_infos,
+                    self.puuid,
+                    self.platform,
+                ),
+                scheduler.submit(
+                    PROFILE,
+                    self._load_into,
+                    "rank_info",
+                    self._rank_api.get_rank_info,
+                    self.puuid,
+                    self.platform,
+                    by_puuid=True,
+                ),
+                scheduler.submit(
+                    PROFILE,
+                    self._load_into,
+                    "champion_mastery",
+                    self._mastery_api.get_top_masteries,
+                    self.puuid,
+                    self.platform,
+                    count=5,
+                ),
+            ],
+            "recent": [],
+            "timelines": [],
+        }
+
+        recent_ids = (
+            scheduler.submit(
+                PROFILE,
+                self._match_api.get_match_history,
+                self.puuid,
+                self.region,
+                count=recent,
+                queue=queue,
+                match_type=match_type,
+            ).result()
+            or []
         )
+        # Riot lists newest first, match_history is oldest first
+        self.match_history = list(reversed(recent_ids))
+
+        for match_id in recent_ids:
+            futures["recent"].append(
+                self._schedule_details(
+                    scheduler, RECENT_DETAILS, match_id, recent_deadline
+                )
+            )
+        if with_timelines:
+            for match_id in recent_ids:
+                futures["timelines"].append(
+                    scheduler.submit(TIMELINES, self._fetch_loaded_timeline, match_id)
+                )
+
+        # Resolves to the detail futures of the older matches once the year is listed
+        futures["history"] = scheduler.submit(
+            HISTORY,
+            self._schedule_history,
+            scheduler,
+            year,
+            set(recent_ids),
+            queue,
+            match_type,
+        )
+        return futures
+
+    def _load_into(self, attribute, fetch, *args, **kwargs):
+        value = fetch(*args, **kwargs)
+        setattr(self, attribute, value)
+        return value
+
+    def _schedule_history(
+        self, scheduler, year, recent_ids, queue=None, match_type=None
+    ):
+        # Runs on a scheduler worker: uses the scheduler it was given, reading
+        # client.scheduler here would wait on the lock close() holds
+        year_ids = (
+            self._match_api.get_year_match_history(
+                self.puuid, self.region, year, queue=queue, match_type=match_type
+            )
+            or []
+        )
+        return self._schedule_listed(scheduler, year_ids, recent_ids)
+
+    def _schedule_listed(self, scheduler, year_ids, recent_ids):
+        listed = set(year_ids)
+        with self._loaded_lock:
+            self.match_history = year_ids + [
+                match_id for match_id in self.match_history if match_id not in listed
+            ]
+        return [
+            self._schedule_details(scheduler, HISTORY, match_id)
+            for match_id in year_ids
+            if match_id not in recent_ids
+        ]
+
+    def _schedule_details(self, scheduler, priority, match_id, deadline=None):
+        return scheduler.submit(
+            priority, self._fetch_loaded_match, match_id, deadline=deadline
+        )
+
+    def _fetch_loaded_match(self, match_id):
+        match = self._match_api.get_match_details(match_id, self.region)
+        if match:
+            with self._loaded_lock:
+                self._loaded_matches[match_id] = match
+        return match
+
+    def _fetch_loaded_timeline(self, match_id):
+        timeline = self._match_api.get_match_timeline(match_id, self.region, compact=True)
+        if timeline:
+            with self._loaded_lock:
+                self._loaded_timelines[match_id] = timeline
+        return timeline
+
+    def collect_loaded(self):
+        # Snapshot of what load_prioritized has fetched, ready for process_matches()
+        with self._loaded_lock:
+            loaded_ids = [
+                match_id for match_id in self.match_history if match_id in self._loaded_matches
+            ]
+            self.matches = [self._loaded_matches[match_id] for match_id in loaded_ids]
+            self.timelines.update(self._loaded_timelines)
+        return self.matches
+
+    def sync_matches(self, year=2024, workers=1, queue=None, match_type=None):
+        # Daily refresh: only list matches after the last one seen, and only
+        # download details for new IDs (known ones come from the match cache)
+        store = self.client.sync_store
+        # Each filter keeps its own cursor, a ranked-only sync can't skip normals
+        cursor_key = self.puuid + self._match_api.filter_key(queue, match_type)
+        cursor = store.get_cursor(cursor_key) if store else None
+
+        if cursor is None:
+            print("No sync cursor, loading the whole year")
+            self.match_history, listed = self._match_api.get_year_match_history(
+                self.puuid,
+                self.region,
+                year,
+                queue=queue,
+                match_type=match_type,
+                return_complete=True,
+            )
+            last_timestamp = None
+        else:
+            last_timestamp, known_ids = cursor
+            new_ids, listed = self._match_api.get_match_ids_since(
+                self.puuid,
+                self.region,
+                start_time=last_timestamp,
+                queue=queue,
+                match_type=match_type,
+                return_complete=True,
+            )
+            known = set(known_ids)
+            new_ids = [match_id for match_id in new_ids if match_id not in known]
+            print(f"{len(new_ids)} new matches since last sync")
+            self.match_history = known_ids + new_ids
+
+        self.load_match_details(workers=workers)
+
+        if self.matches:
+            # Riot's startTime is in seconds and inclusive: the last game is listed
+            # again next time and dropped as already known
+            last_timestamp = max(
+                match["info"]["gameCreation"] for match in self.matches
+            ) // 1000
+
+        # A listing page that failed may hide games older than the newest one
+        # loaded: moving the cursor past them would skip them for good
+        if not listed:
+            print("Match listing incomplete, sync cursor not moved")
+        elif store and last_timestamp is not None and not self.failed_match_ids:
+            store.set_cursor(cursor_key, last_timestamp, self.match_history)
+
+        return self.matches
+
+    def load_match_details(self, workers=1):
+        if self.store is not None:
+            # Matches another tracked player already brought in are not downloaded again
+            missing = [
+                match_id for match_id in self.match_history if match_id not in self.store
+            ]
+            matches, self.failed_match_ids = self._match_api.get_bulk_match_details(
+                missing, self.region, workers=workers, return_failed=True
+            )
+            for match in matches:
+                self.store.add(match)
+            return self.load_shared_matches()
+
+        self.matches, self.failed_match_ids = self._match_api.get_bulk_match_details(
+            self.match_history, self.region, workers=workers, return_failed=True
+        )
+        return self.matches
+
+    def load_shared_matches(self):
+        # Every stored match this player took part in, whoever it was downloaded for
+        self.matches = self.store.matches_for(self.puuid)
+        self.match_history = [match["metadata"]["matchId"] for match in self.matches]
         return self.matches
 
     def _detect_role(self, participant):
@@ -161,7 +568,78 @@ class Player:
 
         return stats
 
-    def process_matches(self):
+    def iter_match_stats(self, match_ids=None, with_timelines=False, workers=4):
+        # Yields extracted stats match by match while the next ones download,
+        # raw payloads are dropped as soon as they are extracted
+        match_ids = iter(self.match_history if match_ids is None else match_ids)
+        self.failed_match_ids = []
+
+        def fetch(match_id):
+            match = self._match_api.get_match_details(match_id, self.region)
+            timeline = None
+            if match and with_timelines:
+                timeline = self._match_api.get_match_timeline(
+                    match_id, self.region, compact=True
+                )
+            return match_id, match, timeline
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Keep a bounded window in flight, results come out in match_ids order
+            pending = deque(
+                pool.submit(fetch, match_id)
+                for match_id in islice(match_ids, workers * 2)
+            )
+
+            while pending:
+                match_id, match, timeline = pending.popleft().result()
+
+                next_id = next(match_ids, None)
+                if next_id is not None:
+                    pending.append(pool.submit(fetch, next_id))
+
+                if not match:
+                    self.failed_match_ids.append(match_id)
+                    continue
+
+                stats = self._extract_stats(match, timeline)
+                if stats:
+                    yield stats
+
+    def process_matches(
+        self,
+        stream=False,
+        with_timelines=False,
+        workers=4,
+        timeline_limit=None,
+        timeline_queues=None,
+        incremental=False,
+        processes=None,
+        chunk_size=EXTRACT_CHUNK_SIZE,
+    ):
+        # with_timelines fetches the missing timelines of the selected matches only
+        # (see timeline_match_ids), timelines already loaded are always used.
+        # incremental: add the matches not counted yet to the running aggregate
+        # (kept from the last call or load_aggregate) instead of starting over.
+        # processes: extract on that many processes, reading the match cache
+        processed_stats, aggregate = self._start_aggregate(incremental)
+
+        if stream:
+            # Straight from match_history, without keeping self.matches around
+            match_ids = [
+                match_id
+                for match_id in self.match_history
+                if match_id not in aggregate.match_ids
+            ]
+            print(f"\nStreaming {len(match_ids)} matches...")
+            for stats in self.iter_match_stats(
+                match_ids, with_timelines=with_timelines, workers=workers
+            ):
+                processed_stats.append(stats)
+                aggregate.append(stats)
+            self.aggregated_stats = self._aggregate_stats(processed_stats, aggregate)
+            print(f"Processing complete!\n")
+            return self.aggregated_stats
+
         if not self.matches:
             print("No matches loaded. Call load_recent_matches() first.")
             return None
@@ -170,24 +648,93 @@ class Player:
         print(f"  Processing {len(self.matches)} matches...")
         print(f"{'=' * 60}\n")
 
-        processed_stats = []
+        if with_timelines:
+            self.load_match_timelines(
+                workers=workers, limit=timeline_limit, queues=timeline_queues
+            )
 
-        has_timelines = hasattr(self, "timelines") and self.timelines
+        if processes and self.client.match_cache:
+            extracted = self._extract_in_pool(
+                [
+                    match["metadata"]["matchId"]
+                    for match in self.matches
+                    if match["metadata"]["matchId"] not in aggregate.match_ids
+                ],
+                processes,
+                chunk_size,
+            )
+        else:
+            extracted = (
+                self._extract_stats(match, self.timelines.get(match["metadata"]["matchId"]))
+                for match in self.matches
+                if match["metadata"]["matchId"] not in aggregate.match_ids
+            )
 
-        for i, match in enumerate(self.matches):
-            stats = self._extract_match_stats(match)
+        for stats in extracted:
             if stats:
-                if has_timelines and i < len(self.timelines):
-                    timeline_stats = self._extract_timeline_stats(match, self.timelines[i])
-                    if timeline_stats:
-                        stats.update(timeline_stats)
                 processed_stats.append(stats)
+                aggregate.append(stats)
 
-        self.aggregated_stats = self._aggregate_stats(processed_stats)
+        self.aggregated_stats = self._aggregate_stats(processed_stats, aggregate)
 
         print(f"Processing complete!\n")
         return self.aggregated_stats
 
+    def _extract_stats(self, match, timeline=None):
+        stats = self._extract_match_stats(match)
+        if stats and timeline:
+            timeline_stats = self._extract_timeline_stats(match, timeline)
+            if timeline_stats:
+                stats.update(timeline_stats)
+        return stats
+
+    def _extract_in_pool(self, match_ids, processes, chunk_size=EXTRACT_CHUNK_SIZE):
+        # Chunks go out as match IDs and every worker reads the payloads from the
+        # match cache itself: only the extracted rows are pickled, not the matches.
+        # Results come back in match_ids order, whatever chunk finishes first
+        chunks = [
+            match_ids[i : i + chunk_size] for i in range(0, len(match_ids), chunk_size)
+        ]
+        loaded = {match["metadata"]["matchId"]: match for match in self.matches}
+
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            # The parent runs lane and scheduler threads, don't fork them
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_extract_worker,
+            initargs=(self.puuid, self.client.match_cache.path),
+        ) as pool:
+            # Only the IDs that need a timeline, the worker reads it from the cache too
+            timeline_ids = [
+                [match_id for match_id in chunk if match_id in self.timelines]
+                for chunk in chunks
+            ]
+            results = pool.map(_extract_chunk, chunks, timeline_ids)
+
+            for chunk, rows in zip(chunks, results):
+                for match_id, stats in zip(chunk, rows):
+                    if stats == _NOT_CACHED:
+                        # Not in the cache (yet): extract here from memory
+                        match = loaded.get(match_id)
+                        stats = (
+                            self._extract_stats(match, self.timelines.get(match_id))
+                            if match
+                            else None
+                        )
+                    yield stats
+
+    def _start_aggregate(self, incremental):
+        if not incremental:
+            return [], self._new_aggregate()
+
+        # Rows from earlier calls of this session. A loaded aggregate has none: after
+        # load_aggregate, raw_match_stats only holds the matches added since, the
+        # totals (and get_role_specific_stats) come from the aggregate
+        rows = (self.aggregated_stats or {}).get("raw_match_stats", [])
+        if not isinstance(self.aggregate, StatsAccumulator):
+            self.aggregate = StatsAccumulator().extend(rows)
+        return list(rows), self.aggregate
+
     def _extract_timeline_stats(self, match, timeline):
         my_participant = None
         participant_id = None
@@ -254,99 +801,97 @@ class Player:
 
         return timeline_stats
 
-    def _aggregate_stats(self, processed_stats):
-        if not processed_stats:
+    def _new_aggregate(self, mergeable=False):
+        # Filled match by match while extracting: typed columns and vectorized
+        # reductions with numpy, single-pass running totals without it. Only
+        # running totals merge and save, so incremental runs always use those
+        if np is not None and not mergeable:
+            return MatchColumns()
+        return StatsAccumulator()
+
+    def _aggregate_stats(self, processed_stats, aggregate=None):
+        # aggregate: filled during extraction, otherwise built here in one pass
+        if aggregate is None:
+            aggregate = self._new_aggregate().extend(processed_stats)
+        if not len(aggregate):
             return {}
 
-        from datetime import datetime
-
-        total_games = len(processed_stats)
-
-        role_counts = {}
-        for stat in processed_stats:
-            role = stat["role"]
-            role_counts[role] = role_counts.get(role, 0) + 1
-
-        primary_role = max(role_counts, key=role_counts.get)
-
-        wins = sum(1 for s in processed_stats if s["win"])
-
-        champion_stats = {}
-        for stat in processed_stats:
-            champ_id = stat["champion_id"]
-            if champ_id not in champion_stats:
-                champion_stats[champ_id] = {
-                    "champion_name": stat["champion_name"],
-                    "games": 0,
-                    "wins": 0,
-                    "total_kda": 0,
-                    "total_cs_per_min": 0,
-                }
-
-            champion_stats[champ_id]["games"] += 1
-            if stat["win"]:
-                champion_stats[champ_id]["wins"] += 1
-            champion_stats[champ_id]["total_kda"] += stat["kda"]
-            champion_stats[champ_id]["total_cs_per_min"] += stat["cs_per_min"]
-
-        champion_performance = []
-        for champ_id, data in champion_stats.items():
-            champion_performance.append(
-                {
-                    "champion_id": champ_id,
-                    "champion_name": data["champion_name"],
-                    "games": data["games"],
-                    "win_rate": data["wins"] / data["games"],
-                    "avg_kda": round(data["total_kda"] / data["games"], 2),
-                    "avg_cs_per_min": round(data["total_cs_per_min"] / data["games"], 2),
-                }
-            )
-
-        champion_performance.sort(key=lambda x: x["games"], reverse=True)
-
-        stats_with_cs10 = [
-            s for s in processed_stats if "cs_at_10" in s and s["cs_at_10"] > 0
-        ]
+        self.aggregate = aggregate
+        return self._build_aggregated(aggregate.summary(), processed_stats)
 
-        if stats_with_cs10:
-            avg_cs_at_10 = sum(s["cs_at_10"] for s in stats_with_cs10) / len(stats_with_cs10)
-            avg_gold_at_10 = sum(s["gold_at_10"] for s in stats_with_cs10) / len(stats_with_cs10)
-        else:
-            avg_cs_at_10 = None
-            avg_gold_at_10 = None
-
-        all_death_events = []
-        death_timing_total = {"0-10min": 0, "10-20min": 0, "20-30min": 0, "30min+": 0}
-
-        for stat in processed_stats:
-            if "death_events" in stat:
-                all_death_events.extend(stat["death_events"])
-            if "death_timing" in stat:
-                for period, count in stat["death_timing"].items():
-                    death_timing_total[period] += count
-
-        monthly_performance = {}
-
-        for stat in processed_stats:
-            if "game_creation" in stat:
-                date = datetime.fromtimestamp(stat["game_creation"] / 1000)
-                month_key = date.strftime("%Y-%m")
-
-                if month_key not in monthly_performance:
-                    monthly_performance[month_key] = {
-                        "games": 0,
-                        "wins": 0,
-                        "total_kda": 0,
-                    }
-
-                monthly_performance[month_key]["games"] += 1
-                if stat["win"]:
-                    monthly_performance[month_key]["wins"] += 1
-                monthly_performance[month_key]["total_kda"] += stat["kda"]
-
-        for month, data in monthly_performance.items():
-            data["win_rate"] = round(data["wins"] / data["games"], 2)
-            data["avg_kda"] = round(data["total_kda"] / data["games"], 2)
+    def save_aggregate(self, path):
+        if not isinstance(self.aggregate, StatsAccumulator):
+            print("Nothing to save. Call process_matches(incremental=True) first.")
+            return False
+        self.aggregate.save(path)
+        return True
+
+    def load_aggregate(self, path):
+        # Next process_matches(incremental=True) only extracts matches not in it.
+        # Saved aggregates keep totals, not rows: see _start_aggregate
+        self.aggregate = StatsAccumulator.load(path)
+        return self.aggregate
+
+    def aggregate_shards(self, shards, workers=4):
+        # Map: every shard (a list of match IDs) is fetched and aggregated on its
+        # own worker. Reduce: the partial aggregates merge back in shard order
+        shards = self._dedupe_shards(shards)
+
+        def aggregate_shard(match_ids):
+            accumulator = StatsAccumulator()
+            rows = []
+            for match_id in match_ids:
+                match = self._match_api.get_match_details(match_id, self.region)
+                stats = (
+                    self._extract_stats(match, self.timelines.get(match_id))
+                    if match
+                    else None
+                )
+                if not stats:
+                    continue
+                rows.append(stats)
+                accumulator.append(stats)
+            return accumulator, rows
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(aggregate_shard, shards))
+
+        processed_stats = [row for _, rows in results for row in rows]
+        self.aggregated_stats = self._aggregate_stats(
+            processed_stats, merge_aggregates(partial for partial, _ in results)
+        )
+        return self.aggregated_stats
+
+    def _dedupe_shards(self, shards):
+        # Partial aggregates can't drop a match counted twice, so a match listed in
+        # several shards only stays in the first one
+        seen = set()
+        deduped = []
+        self.duplicate_match_ids = []
+        for shard in shards:
+            unique = []
+            for match_id in shard:
+                if match_id in seen:
+                    self.duplicate_match_ids.append(match_id)
+                else:
+                    seen.add(match_id)
+                    unique.append(match_id)
+            deduped.append(unique)
+
+        if self.duplicate_match_ids:
+            print(
+                f"Skipping {len(self.duplicate_match_ids)} match IDs already in an"
+                f" earlier shard"
+            )
+        return deduped
+
+    def _build_aggregated(self, summary, processed_stats):
+        total_games = summary["total_games"]
+        role_counts = summary["role_counts"]
+        wins = summary["wins"]
+        averages = summary["averages"]
+        avg_cs_at_10 = summary["avg_cs_at_10"]
+        avg_gold_at_10 = summary["avg_gold_at_10"]
 
         aggregated = {
             "player_info": {
@@ -357,7 +902,7 @@ class Player:
                 if self.summoner_info
                 else 0,
                 "total_games_analyzed": total_games,
-                "primary_role": primary_role,
+                "primary_role": max(role_counts, key=role_counts.get),
                 "rank": self._get_rank_string(),
             },
             "role_distribution": role_counts,
@@ -366,52 +911,35 @@ class Player:
                 "wins": wins,
                 "losses": total_games - wins,
                 "win_rate": round(wins / total_games, 3),
-                "avg_kda": round(
-                    sum(s["kda"] for s in processed_stats) / total_games, 2
-                ),
-                "avg_kills": round(
-                    sum(s["kills"] for s in processed_stats) / total_games, 2
-                ),
-                "avg_deaths": round(
-                    sum(s["deaths"] for s in processed_stats) / total_games, 2
-                ),
-                "avg_assists": round(
-                    sum(s["assists"] for s in processed_stats) / total_games, 2
-                ),
+                "avg_kda": round(averages["kda"], 2),
+                "avg_kills": round(averages["kills"], 2),
+                "avg_deaths": round(averages["deaths"], 2),
+                "avg_assists": round(averages["assists"], 2),
             },
             "early_game": {
                 "avg_cs_at_10": round(avg_cs_at_10, 1) if avg_cs_at_10 else None,
                 "avg_gold_at_10": round(avg_gold_at_10, 0) if avg_gold_at_10 else None,
             },
             "farming": {
-                "avg_cs_per_min": round(
-                    sum(s["cs_per_min"] for s in processed_stats) / total_games, 2
-                ),
+                "avg_cs_per_min": round(averages["cs_per_min"], 2),
             },
             "vision": {
-                "avg_vision_score": round(
-                    sum(s["vision_score"] for s in processed_stats) / total_games, 1
-                ),
-                "avg_wards_placed": round(
-                    sum(s["wards_placed"] for s in processed_stats) / total_games, 1
-                ),
-                "avg_control_wards": round(
-                    sum(s["control_wards_placed"] for s in processed_stats) / total_games,
-                    1,
-                ),
+                "avg_vision_score": round(averages["vision_score"], 1),
+                "avg_wards_placed": round(averages["wards_placed"], 1),
+                "avg_control_wards": round(averages["control_wards_placed"], 1),
             },
             "damage": {
-                "avg_damage_per_min": round(
-                    sum(s["damage_per_min"] for s in processed_stats) / total_games, 0
-                ),
+                "avg_damage_per_min": round(averages["damage_per_min"], 0),
             },
             "death_analysis": {
-                "total_deaths": sum(s["deaths"] for s in processed_stats),
-                "death_timing": death_timing_total,
-                "death_events": all_death_events,
+                "total_deaths": summary["total_deaths"],
+                "death_timing": summary["death_timing"],
+                "death_events": summary["death_events"],
             },
-            "champion_performance": champion_performance[:10],
-            "monthly_trends": dict(sorted(monthly_performance.items())),
+            "champion_performance": summary["champion_performance"][:10],
+            "monthly_trends": dict(sorted(summary["monthly_performance"].items())),
+            # Per-match rows extracted in this session, which is every counted match
+            # unless the run started from load_aggregate (then only the new ones)
             "raw_match_stats": processed_stats,
         }
 
@@ -424,6 +952,9 @@ class Player:
 
         target_role = role or self.aggregated_stats["player_info"]["primary_role"]
 
+        if self.aggregate is not None:
+            return self.aggregate.role_stats(target_role)
+
         role_matches = [
             m
             for m in self.aggregated_stats["raw_match_stats"]
@@ -447,25 +978,76 @@ class Player:
             / total,
         }
 
-    def load_match_timelines(self):
+    def timeline_match_ids(self, limit=None, queues=None):
+        # The matches worth a timeline call: e.g. limit=20, queues=RANKED_QUEUES for
+        # the last 20 ranked games. Needs self.matches to filter on queue
+        if not self.matches:
+            match_ids = list(self.match_history)
+            return match_ids[-limit:] if limit else match_ids
+
+        matches = sorted(self.matches, key=lambda match: match["info"]["gameCreation"])
+        if queues:
+            matches = [match for match in matches if match["info"].get("queueId") in queues]
+        if limit:
+            matches = matches[-limit:]
+        return [match["metadata"]["matchId"] for match in matches]
+
+    def get_timeline(self, match_id, compact=True):
+        # One timeline on demand, kept for the next reader
+        timeline = self.timelines.get(match_id)
+        if timeline is None and self.store is not None:
+            timeline = self.store.get_timeline(match_id)
+        if timeline is None:
+            timeline = self._match_api.get_match_timeline(match_id, self.region, compact)
+            if timeline and self.store is not None:
+                self.store.add_timeline(match_id, timeline)
+        if timeline:
+            self.timelines[match_id] = timeline
+        return timeline
+
+    def load_match_timelines(self, workers=1, compact=True, limit=None, queues=None):
         if not self.match_history:
             print("No match history. Load matches first.")
-            return []
+            return {}
+
+        match_ids = [
+            match_id
+            for match_id in self.timeline_match_ids(limit, queues)
+            if match_id not in self.timelines
+        ]
+        if not match_ids:
+            return self.timelines
 
-        print(f"\nFetching timelines for {len(self.match_history)} matches...")
+        print(f"\nFetching timelines for {len(match_ids)} matches...")
         print(f"   (This will take a while due to rate limits)\n")
 
-        self.timelines = []
+        if self.store is not None:
+            return self._load_shared_timelines(match_ids, workers, compact)
+
+        timelines, self.failed_timeline_ids = self._match_api.get_bulk_match_timelines(
+            match_ids,
+            self.region,
+            workers=workers,
+            return_failed=True,
+            compact=compact,
+            keyed=True,
+        )
+        self.timelines.update(timelines)
+
+        print(f"\nLoaded {len(timelines)} timelines\n")
+        return self.timelines
 
-        for i, match_id in enumerate(self.match_history):
-            timeline = self._match_api.get_match_timeline(match_id, self.region)
-            if timeline:
-                self.timelines.append(timeline)
+    def _load_shared_timelines(self, match_ids, workers=1, compact=True):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            timelines = list(
+                pool.map(lambda match_id: self.get_timeline(match_id, compact), match_ids)
+            )
 
-            if (i + 1) % 10 == 0:
-                print(f"  Progress: {i + 1}/{len(self.match_history)}")
+        self.failed_timeline_ids = [
+            match_id for match_id, timeline in zip(match_ids, timelines) if not timeline
+        ]
 
-        print(f"\nLoaded {len(self.timelines)} timelines\n")
+        print(f"\nLoaded {len(match_ids) - len(self.failed_timeline_ids)} timelines\n")
         return self.timelines
 
     def _get_rank_string(self):
@@ -633,3 +1215,460 @@ class Player:
         self.aggregated_stats["strengths"] = strengths
 
         return weaknesses, strengths
+
+
+class AsyncPlayer(Player):
+    # Same analytics as Player, loading methods are coroutines sharing one event loop.
+    # They keep Player's signatures: workers is accepted, but concurrency is capped
+    # by the client's max_in_flight instead. process_matches() stays synchronous and
+    # only analyzes what is loaded, so stream=True and with_timelines=True raise
+    # TypeError: await process_stream(), or await load_match_timelines() first
+    ACCOUNT_API = AsyncRiotAccountAPI
+    SUMMONER_API = AsyncSummoner
+    RANK_API = AsyncRank
+    MATCH_API = AsyncMatch
+    MASTERY_API = AsyncChampionMastery
+
+    async def load_profile(self):
+        print(f"Loading profile: {self.game_name}#{self.tag_line}")
+
+        self.puuid = await self._account_api.get_puuid(
+            self.game_name, self.tag_line, self.region
+        )
+        if not self.puuid:
+            print("Failed to get PUUID")
+            return False
+
+        await self._load_platform_profile()
+
+        print(f"Profile loaded")
+        return True
+
+    async def _load_platform_profile(self):
+        (
+            self.summoner_info,
+            self.rank_info,
+            self.champion_mastery,
+        ) = await asyncio.gather(
+            self._summoner_api.get_summoner_infos(self.puuid, self.platform),
+            self._rank_api.get_rank_info(self.puuid, self.platform, by_puuid=True),
+            self._mastery_api.get_top_masteries(self.puuid, self.platform, count=5),
+        )
+
+    async def load(self, year=2024, queue=None, match_type=None):
+        print(f"Loading profile and {year} matches: {self.game_name}#{self.tag_line}")
+
+        self.puuid = await self._account_api.get_puuid(
+            self.game_name, self.tag_line, self.region
+        )
+        if not self.puuid:
+            print("Failed to get PUUID")
+            return False
+
+        await asyncio.gather(
+            self._load_platform_profile(),
+            self.load_year_matches(year, queue, match_type),
+        )
+        return True
+
+    async def load_recent_matches(
+        self, count=100, workers=None, queue=None, match_type=None
+    ):
+        print(f"\nLoading {count} most recent matches...")
+        self.match_history = await self._match_api.get_match_history(
+            self.puuid, self.region, count=count, queue=queue, match_type=match_type
+        )
+        print(f"Found {len(self.match_history)} matches")
+        return await self.load_match_details()
+
+    async def load_year_matches(self, year=2024, queue=None, match_type=None):
+        self.match_history = await self._match_api.get_year_match_history(
+            self.puuid, self.region, year, queue=queue, match_type=match_type
+        )
+        return self.match_history
+
+    async def load_match_details(self, workers=None):
+        if self.store is not None:
+            # Same as Player: only what the shared MatchStore doesn't hold yet
+            missing = [
+                match_id for match_id in self.match_history if match_id not in self.store
+            ]
+            (
+                matches,
+                self.failed_match_ids,
+            ) = await self._match_api.get_bulk_match_details(
+                missing, self.region, return_failed=True
+            )
+            for match in matches:
+                self.store.add(match)
+            return self.load_shared_matches()
+
+        (
+            self.matches,
+            self.failed_match_ids,
+        ) = await self._match_api.get_bulk_match_details(
+            self.match_history, self.region, return_failed=True
+        )
+        return self.matches
+
+    async def _run_blocking(self, fn, *args):
+        # SQLite (sync store, match cache) off the event loop
+        return await self._match_api._run_blocking(fn, *args)
+
+    async def sync_matches(self, year=2024, workers=None, queue=None, match_type=None):
+        store = self.client.sync_store
+        cursor_key = self.puuid + self._match_api.filter_key(queue, match_type)
+        cursor = await self._run_blocking(store.get_cursor, cursor_key) if store else None
+
+        if cursor is None:
+            print("No sync cursor, loading the whole year")
+            self.match_history, listed = await self._match_api.get_year_match_history(
+                self.puuid,
+                self.region,
+                year,
+                queue=queue,
+                match_type=match_type,
+                return_complete=True,
+            )
+            last_timestamp = None
+        else:
+            last_timestamp, known_ids = cursor
+            new_ids, listed = await self._match_api.get_match_ids_since(
+                self.puuid,
+                self.region,
+                start_time=last_timestamp,
+                queue=queue,
+                match_type=match_type,
+                return_complete=True,
+            )
+            known = set(known_ids)
+            new_ids = [match_id for match_id in new_ids if match_id not in known]
+            print(f"{len(new_ids)} new matches since last sync")
+            self.match_history = known_ids + new_ids
+
+        await self.load_match_details()
+
+        if self.matches:
+            last_timestamp = max(
+                match["info"]["gameCreation"] for match in self.matches
+            ) // 1000
+
+        if not listed:
+            print("Match listing incomplete, sync cursor not moved")
+        elif store and last_timestamp is not None and not self.failed_match_ids:
+            await self._run_blocking(
+                store.set_cursor, cursor_key, last_timestamp, self.match_history
+            )
+
+        return self.matches
+
+    async def download_year(
+        self,
+        year=2024,
+        with_timelines=False,
+        workers=None,
+        compact=True,
+        queue=None,
+        match_type=None,
+    ):
+        # Player.download_year: same journal, so either class resumes the other's run
+        store = self.client.sync_store
+        cache = self.client.match_cache
+        job = f"{self.puuid}:{year}{self._match_api.filter_key(queue, match_type)}"
+        match_ids = await self._run_blocking(store.get_job, job) if store else None
+
+        if match_ids is None:
+            await self.load_year_matches(year, queue, match_type)
+            if store:
+                await self._run_blocking(store.put_job, job, self.match_history)
+        else:
+            self.match_history = match_ids
+            left = (
+                len(await self._run_blocking(cache.missing, "match", match_ids))
+                if cache
+                else len(match_ids)
+            )
+            print(
+                f"Resuming {year} download: {len(match_ids) - left}/{len(match_ids)}"
+                f" matches already saved"
+            )
+
+        await self.load_match_details()
+        if with_timelines:
+            await self.load_match_timelines(compact=compact)
+
+        if store:
+            await self._run_blocking(store.delete_job, job)
+        return self.matches
+
+    async def aggregate_shards(self, shards, workers=None):
+        # Player.aggregate_shards with every shard downloaded concurrently
+        shards = self._dedupe_shards(shards)
+        results = await asyncio.gather(
+            *(
+                self._match_api.get_bulk_match_details(shard, self.region)
+                for shard in shards
+            )
+        )
+
+        partials = []
+        processed_stats = []
+        for matches in results:
+            accumulator = StatsAccumulator()
+            for match in matches:
+                stats = self._extract_stats(
+                    match, self.timelines.get(match["metadata"]["matchId"])
+                )
+                if stats:
+                    processed_stats.append(stats)
+                    accumulator.append(stats)
+            partials.append(accumulator)
+
+        self.aggregated_stats = self._aggregate_stats(
+            processed_stats, merge_aggregates(partials)
+        )
+        return self.aggregated_stats
+
+    async def load_prioritized(
+        self,
+        year=2024,
+        recent=20,
+        with_timelines=True,
+        recent_deadline=None,
+        queue=None,
+        match_type=None,
+    ):
+        # Player.load_prioritized on the client's async_scheduler: the stages are
+        # tasks on this loop, ordered by priority. Returns asyncio futures, call
+        # collect_loaded() at any point like with Player
+        scheduler = self.client.async_scheduler
+        with self._loaded_lock:
+            self._loaded_matches = {}
+            self._loaded_timelines = {}
+
+        self.puuid = await self._account_api.get_puuid(
+            self.game_name, self.tag_line, self.region
+        )
+        if not self.puuid:
+            print("Failed to get PUUID")
+            return None
+
+        futures = {
+            "profile": [
+                scheduler.submit(
+                    PROFILE,
+                    self._load_into,
+                    "summoner_info",
+                    self._summoner_api.get_summoner_infos,
+                    self.puuid,
+                    self.platform,
+                ),
+                scheduler.submit(
+                    PROFILE,
+                    self._load_into,
+                    "rank_info",
+                    self._rank_api.get_rank_info,
+                    self.puuid,
+                    self.platform,
+                    by_puuid=True,
+                ),
+                scheduler.submit(
+                    PROFILE,
+                    self._load_into,
+                    "champion_mastery",
+                    self._mastery_api.get_top_masteries,
+                    self.puuid,
+                    self.platform,
+                    count=5,
+                ),
+            ],
+            "recent": [],
+            "timelines": [],
+        }
+
+        recent_ids = (
+            await scheduler.submit(
+                PROFILE,
+                self._match_api.get_match_history,
+                self.puuid,
+                self.region,
+                count=recent,
+                queue=queue,
+                match_type=match_type,
+            )
+            or []
+        )
+        self.match_history = list(reversed(recent_ids))
+
+        for match_id in recent_ids:
+            futures["recent"].append(
+                self._schedule_details(
+                    scheduler, RECENT_DETAILS, match_id, recent_deadline
+                )
+            )
+        if with_timelines:
+            for match_id in recent_ids:
+                futures["timelines"].append(
+                    scheduler.submit(TIMELINES, self._fetch_loaded_timeline, match_id)
+                )
+
+        futures["history"] = scheduler.submit(
+            HISTORY,
+            self._schedule_history,
+            scheduler,
+            year,
+            set(recent_ids),
+            queue,
+            match_type,
+        )
+        return futures
+
+    async def _load_into(self, attribute, fetch, *args, **kwargs):
+        value = await fetch(*args, **kwargs)
+        setattr(self, attribute, value)
+        return value
+
+    async def _schedule_history(
+        self, scheduler, year, recent_ids, queue=None, match_type=None
+    ):
+        year_ids = (
+            await self._match_api.get_year_match_history(
+                self.puuid, self.region, year, queue=queue, match_type=match_type
+            )
+            or []
+        )
+        return self._schedule_listed(scheduler, year_ids, recent_ids)
+
+    async def _fetch_loaded_match(self, match_id):
+        match = await self._match_api.get_match_details(match_id, self.region)
+        if match:
+            with self._loaded_lock:
+                self._loaded_matches[match_id] = match
+        return match
+
+    async def _fetch_loaded_timeline(self, match_id):
+        timeline = await self._match_api.get_match_timeline(
+            match_id, self.region, compact=True
+        )
+        if timeline:
+            with self._loaded_lock:
+                self._loaded_timelines[match_id] = timeline
+        return timeline
+
+    async def get_timeline(self, match_id, compact=True):
+        timeline = self.timelines.get(match_id)
+        if timeline is None and self.store is not None:
+            timeline = self.store.get_timeline(match_id)
+        if timeline is None:
+            timeline = await self._match_api.get_match_timeline(
+                match_id, self.region, compact
+            )
+            if timeline and self.store is not None:
+                self.store.add_timeline(match_id, timeline)
+        if timeline:
+            self.timelines[match_id] = timeline
+        return timeline
+
+    async def load_match_timelines(
+        self, workers=None, compact=True, limit=None, queues=None
+    ):
+        if not self.match_history:
+            print("No match history. Load matches first.")
+            return {}
+
+        match_ids = [
+            match_id
+            for match_id in self.timeline_match_ids(limit, queues)
+            if match_id not in self.timelines
+        ]
+        if not match_ids:
+            return self.timelines
+
+        print(f"\nFetching timelines for {len(match_ids)} matches...")
+        if self.store is not None:
+            timelines = await asyncio.gather(
+                *(self.get_timeline(match_id, compact) for match_id in match_ids)
+            )
+            self.failed_timeline_ids = [
+                match_id
+                for match_id, timeline in zip(match_ids, timelines)
+                if not timeline
+            ]
+            return self.timelines
+
+        (
+            timelines,
+            self.failed_timeline_ids,
+        ) = await self._match_api.get_bulk_match_timelines(
+            match_ids, self.region, return_failed=True, compact=compact, keyed=True
+        )
+        self.timelines.update(timelines)
+        print(f"\nLoaded {len(timelines)} timelines\n")
+        return self.timelines
+
+    async def iter_match_stats(self, match_ids=None, with_timelines=False, workers=4):
+        # Player.iter_match_stats on tasks: same bounded window, same order
+        match_ids = iter(self.match_history if match_ids is None else match_ids)
+        self.failed_match_ids = []
+
+        async def fetch(match_id):
+            match = await self._match_api.get_match_details(match_id, self.region)
+            timeline = None
+            if match and with_timelines:
+                timeline = await self._match_api.get_match_timeline(
+                    match_id, self.region, compact=True
+                )
+            return match_id, match, timeline
+
+        pending = deque(
+            asyncio.ensure_future(fetch(match_id))
+            for match_id in islice(match_ids, workers * 2)
+        )
+        try:
+            while pending:
+                match_id, match, timeline = await pending.popleft()
+
+                next_id = next(match_ids, None)
+                if next_id is not None:
+                    pending.append(asyncio.ensure_future(fetch(next_id)))
+
+                if not match:
+                    self.failed_match_ids.append(match_id)
+                    continue
+
+                stats = self._extract_stats(match, timeline)
+                if stats:
+                    yield stats
+        finally:
+            # The consumer stopped early: don't leave downloads running
+            for task in pending:
+                task.cancel()
+
+    async def process_stream(self, with_timelines=False, workers=4, incremental=False):
+        # process_matches(stream=True) for AsyncPlayer
+        processed_stats, aggregate = self._start_aggregate(incremental)
+        match_ids = [
+            match_id
+            for match_id in self.match_history
+            if match_id not in aggregate.match_ids
+        ]
+        print(f"\nStreaming {len(match_ids)} matches...")
+        async for stats in self.iter_match_stats(
+            match_ids, with_timelines=with_timelines, workers=workers
+        ):
+            processed_stats.append(stats)
+            aggregate.append(stats)
+        self.aggregated_stats = self._aggregate_stats(processed_stats, aggregate)
+        print(f"Processing complete!\n")
+        return self.aggregated_stats
+
+    def process_matches(self, stream=False, with_timelines=False, **kwargs):
+        # Analytics stay synchronous and can't await the loading coroutines
+        if stream:
+            raise TypeError("AsyncPlayer.process_matches: use await process_stream()")
+        if with_timelines:
+            raise TypeError(
+                "AsyncPlayer.process_matches: await load_match_timelines() first,"
+                " then call process_matches()"
+            )
+        return super().process_matches(**kwargs)
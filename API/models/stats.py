@@ -0,0 +1,290 @@
+from datetime import datetime
+import gzip
+import json
+
+
+# Per-match fields reported as plain averages in the aggregate
+AVERAGED_FIELDS = (
+    "kda",
+    "kills",
+    "deaths",
+    "assists",
+    "cs_per_min",
+    "vision_score",
+    "wards_placed",
+    "control_wards_placed",
+    "damage_per_min",
+)
+
+DEATH_PERIODS = ("0-10min", "10-20min", "20-30min", "30min+")
+
+# Per-role sums behind Player.get_role_specific_stats
+ROLE_FIELDS = ("kda", "cs_per_min", "vision_score", "damage_per_min")
+
+
+class StatsAccumulator:
+    # Every aggregate of Player._aggregate_stats as running totals: one pass per
+    # match whatever the number of metrics, works on a stream of match stats.
+    # Partial results merge (shards of a corpus) and save to disk (incremental runs)
+    VERSION = 1
+
+    def __init__(self):
+        self.match_ids = set()
+        self.total_games = 0
+        self.wins = 0
+        self.sums = {field: 0 for field in AVERAGED_FIELDS}
+        self.role_counts = {}
+        self.roles = {}
+        self.champions = {}
+        self.months = {}
+        self.cs10_games = 0
+        self.cs10_total = 0
+        self.gold10_total = 0
+        self.death_timing = {period: 0 for period in DEATH_PERIODS}
+        self.death_events = []
+
+        # Last month seen as [start, end) in ms, streams are mostly in time order
+        self._month = (None, 0, 0)
+
+    def append(self, stat):
+        # A match already counted is skipped, so feeding a match list again is safe
+        match_id = stat.get("match_id")
+        if match_id is not None:
+            if match_id in self.match_ids:
+                return False
+            self.match_ids.add(match_id)
+
+        win = stat["win"]
+        self.total_games += 1
+        if win:
+            self.wins += 1
+
+        sums = self.sums
+        for field in AVERAGED_FIELDS:
+            sums[field] += stat[field]
+
+        role = stat["role"]
+        self.role_counts[role] = self.role_counts.get(role, 0) + 1
+        role_sums = self.roles.get(role)
+        if role_sums is None:
+            role_sums = self.roles[role] = dict.fromkeys(("wins",) + ROLE_FIELDS, 0)
+        if win:
+            role_sums["wins"] += 1
+        for field in ROLE_FIELDS:
+            role_sums[field] += stat[field]
+
+        champion = self.champions.get(stat["champion_id"])
+        if champion is None:
+            champion = self.champions[stat["champion_id"]] = {
+                "champion_name": stat["champion_name"],
+                "games": 0,
+                "wins": 0,
+                "total_kda": 0,
+                "total_cs_per_min": 0,
+            }
+        champion["games"] += 1
+        if win:
+            champion["wins"] += 1
+        champion["total_kda"] += stat["kda"]
+        champion["total_cs_per_min"] += stat["cs_per_min"]
+
+        if stat.get("cs_at_10", 0) > 0:
+            self.cs10_games += 1
+            self.cs10_total += stat["cs_at_10"]
+            self.gold10_total += stat["gold_at_10"]
+
+        if "death_events" in stat:
+            self.death_events.extend(stat["death_events"])
+        if "death_timing" in stat:
+            for period, count in stat["death_timing"].items():
+                self.death_timing[period] += count
+
+        if "game_creation" in stat:
+            month = self.months.get(self._month_key(stat["game_creation"]))
+            month["games"] += 1
+            if win:
+                month["wins"] += 1
+            month["total_kda"] += stat["kda"]
+        return True
+
+    def extend(self, stats):
+        for stat in stats:
+            self.append(stat)
+        return self
+
+    def __len__(self):
+        return self.total_games
+
+    def _month_key(self, game_creation):
+        key, start, end = self._month
+        if not start <= game_creation < end:
+            date = datetime.fromtimestamp(game_creation / 1000)
+            start_date = datetime(date.year, date.month, 1)
+            end_date = (
+                datetime(date.year + 1, 1, 1)
+                if date.month == 12
+                else datetime(date.year, date.month + 1, 1)
+            )
+            key = date.strftime("%Y-%m")
+            self._month = (
+                key,
+                start_date.timestamp() * 1000,
+                end_date.timestamp() * 1000,
+            )
+            self.months.setdefault(key, {"games": 0, "wins": 0, "total_kda": 0})
+        return key
+
+    def merge(self, other):
+        # Shards must not share matches: totals can't tell a game counted twice
+        overlap = self.match_ids & other.match_ids
+        if overlap:
+            raise ValueError(f"{len(overlap)} matches are in both aggregates")
+
+        self.match_ids |= other.match_ids
+        self.total_games += other.total_games
+        self.wins += other.wins
+        for field, total in other.sums.items():
+            self.sums[field] += total
+
+        for role, count in other.role_counts.items():
+            self.role_counts[role] = self.role_counts.get(role, 0) + count
+        for role, sums in other.roles.items():
+            self._add_totals(self.roles, role, sums)
+        for champ_id, data in other.champions.items():
+            self._add_totals(self.champions, champ_id, data)
+        for month, data in other.months.items():
+            self._add_totals(self.months, month, data)
+
+        self.cs10_games += other.cs10_games
+        self.cs10_total += other.cs10_total
+        self.gold10_total += other.gold10_total
+        for period, count in other.death_timing.items():
+            self.death_timing[period] += count
+        self.death_events.extend(other.death_events)
+        return self
+
+    def _add_totals(self, table, key, data):
+        if key not in table:
+            table[key] = dict(data)
+            return
+        for name, value in data.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                table[key][name] += value
+
+    def role_stats(self, role):
+        sums = self.roles.get(role)
+        if not sums:
+            return None
+
+        total = self.role_counts[role]
+        return {
+            "role": role,
+            "games": total,
+            "win_rate": sums["wins"] / total,
+            "avg_kda": sums["kda"] / total,
+            "avg_cs_per_min": sums["cs_per_min"] / total,
+            "avg_vision_score": sums["vision_score"] / total,
+            "avg_damage_per_min": sums["damage_per_min"] / total,
+        }
+
+    def to_dict(self):
+        return {
+            "version": self.VERSION,
+            "match_ids": sorted(self.match_ids),
+            "total_games": self.total_games,
+            "wins": self.wins,
+            "sums": self.sums,
+            "role_counts": self.role_counts,
+            "roles": self.roles,
+            # JSON keys are strings, champion IDs are not
+            "champions": list(self.champions.items()),
+            "months": self.months,
+            "cs10_games": self.cs10_games,
+            "cs10_total": self.cs10_total,
+            "gold10_total": self.gold10_total,
+            "death_timing": self.death_timing,
+            "death_events": self.death_events,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported aggregate version: {data.get('version')}")
+
+        accumulator = cls()
+        accumulator.match_ids = set(data["match_ids"])
+        accumulator.total_games = data["total_games"]
+        accumulator.wins = data["wins"]
+        accumulator.sums.update(data["sums"])
+        accumulator.role_counts = data["role_counts"]
+        accumulator.roles = data["roles"]
+        accumulator.champions = {champ_id: stats for champ_id, stats in data["champions"]}
+        accumulator.months = data["months"]
+        accumulator.cs10_games = data["cs10_games"]
+        accumulator.cs10_total = data["cs10_total"]
+        accumulator.gold10_total = data["gold10_total"]
+        accumulator.death_timing.update(data["death_timing"])
+        accumulator.death_events = data["death_events"]
+        return accumulator
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path):
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    def summary(self):
+        total_games = self.total_games
+
+        champion_performance = [
+            {
+                "champion_id": champ_id,
+                "champion_name": data["champion_name"],
+                "games": data["games"],
+                "win_rate": data["wins"] / data["games"],
+                "avg_kda": round(data["total_kda"] / data["games"], 2),
+                "avg_cs_per_min": round(data["total_cs_per_min"] / data["games"], 2),
+            }
+            for champ_id, data in self.champions.items()
+        ]
+        champion_performance.sort(key=lambda x: x["games"], reverse=True)
+
+        monthly_performance = {
+            month: {
+                **data,
+                "win_rate": round(data["wins"] / data["games"], 2),
+                "avg_kda": round(data["total_kda"] / data["games"], 2),
+            }
+            for month, data in self.months.items()
+        }
+
+        return {
+            "total_games": total_games,
+            "role_counts": dict(self.role_counts),
+            "wins": self.wins,
+            "averages": {
+                field: total / total_games for field, total in self.sums.items()
+            },
+            "total_deaths": self.sums["deaths"],
+            "champion_performance": champion_performance,
+            "avg_cs_at_10": self.cs10_total / self.cs10_games
+            if self.cs10_games
+            else None,
+            "avg_gold_at_10": self.gold10_total / self.cs10_games
+            if self.cs10_games
+            else None,
+            "death_timing": dict(self.death_timing),
+            "death_events": list(self.death_events),
+            "monthly_performance": monthly_performance,
+        }
+
+
+def merge_aggregates(accumulators):
+    # Reduce step for shards aggregated separately, in shard order
+    merged = StatsAccumulator()
+    for accumulator in accumulators:
+        merged.merge(accumulator)
+    return merged
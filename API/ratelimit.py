@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+
+
+def parse_rate_limits(header):
+    # "20:1,100:120" -> [(20, 1), (100, 120)]
+    limits = []
+    if not header:
+        return limits
+
+    for part in header.split(","):
+        count, window = part.strip().split(":")
+        limits.append((int(count), int(window)))
+
+    return limits
+
+
+class RateWindow:
+    # One Riot tier (limit requests per window seconds). Riot counts in fixed
+    # windows opened by the first request, so budget only comes back when the
+    # whole window is over, never bit by bit
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self.count = 0
+        self.opened = None
+        self.ends = 0
+        self.anchored = False
+
+    def _roll(self, now):
+        if self.opened is not None and now >= self.ends:
+            self.count = 0
+            self.opened = None
+
+    def wait_time(self, now):
+        self._roll(now)
+        if self.count < self.limit:
+            return 0
+        return self.ends - now
+
+    def consume(self, now):
+        self._roll(now)
+        if self.opened is None:
+            # Provisional end until the first response says when Riot opened it
+            self.opened = now
+            self.ends = now + self.window
+            self.anchored = False
+        self.count += 1
+
+    def sync(self, count, now, sent=None):
+        # count: Riot's X-*-Rate-Limit-Count for this window, our request included
+        self._roll(now)
+        if self.opened is None or (sent is not None and sent < self.opened):
+            # Answer to a request of the previous window, says nothing about this one
+            return
+
+        if not self.anchored:
+            # Riot opened the window somewhere between our send and this answer:
+            # ending it from the answer never gives budget back before Riot does
+            self.ends = now + self.window
+            self.anchored = True
+        # Higher than ours when other processes share the key
+        self.count = max(self.count, count)
+
+
+class HostBudget:
+    def __init__(self, app_limits):
+        self.app_buckets = self._build_buckets(parse_rate_limits(app_limits))
+        self.method_buckets = {}
+        self.blocked_until = {}
+
+    def _build_buckets(self, limits, previous=None):
+        previous = {(b.limit, b.window): b for b in previous or []}
+        return [previous.get(limit) or RateWindow(*limit) for limit in limits]
+
+    def _buckets_for(self, method):
+        buckets = list(self.app_buckets)
+        if method:
+            buckets.extend(self.method_buckets.get(method, []))
+        return buckets
+
+    def wait_time(self, method, now):
+        wait = max(
+            self.blocked_until.get(None, 0) - now,
+            self.blocked_until.get(method, 0) - now if method else 0,
+            0,
+        )
+        for bucket in self._buckets_for(method):
+            wait = max(wait, bucket.wait_time(now))
+        return wait
+
+    def consume(self, method, now):
+        for bucket in self._buckets_for(method):
+            bucket.consume(now)
+
+    def update(self, method, headers, now, sent=None):
+        app_limits = parse_rate_limits(headers.get("X-App-Rate-Limit"))
+        if app_limits:
+            self.app_buckets = self._build_buckets(app_limits, self.app_buckets)
+        self._sync(self.app_buckets, headers.get("X-App-Rate-Limit-Count"), now, sent)
+
+        if not method:
+            return
+
+        method_limits = parse_rate_limits(headers.get("X-Method-Rate-Limit"))
+        if method_limits:
+            self.method_buckets[method] = self._build_buckets(
+                method_limits, self.method_buckets.get(method)
+            )
+        self._sync(
+            self.method_buckets.get(method, []),
+            headers.get("X-Method-Rate-Limit-Count"),
+            now,
+            sent,
+        )
+
+    def _sync(self, buckets, count_header, now, sent=None):
+        counts = {window: count for count, window in parse_rate_limits(count_header)}
+        for bucket in buckets:
+            if bucket.window in counts:
+                bucket.sync(counts[bucket.window], now, sent)
+
+    def block(self, until, method=None):
+        self.blocked_until[method] = max(self.blocked_until.get(method, 0), until)
+
+
+class RateLimiter:
+    # Development key limits, replaced as soon as Riot sends X-App-Rate-Limit
+    DEFAULT_APP_LIMITS = "20:1,100:120"
+
+    def __init__(self, app_limits=DEFAULT_APP_LIMITS):
+        self.app_limits = app_limits
+        self.lock = threading.Lock()
+        # Riot counts every routing value (europe, euw1, ...) separately
+        self.budgets = {}
+
+    def _budget(self, host):
+        if host not in self.budgets:
+            self.budgets[host] = HostBudget(self.app_limits)
+        return self.budgets[host]
+
+    def reserve(self, host, method=None):
+        # One try without blocking: 0 once a request slot is taken, else the
+        # seconds to wait before trying again
+        with self.lock:
+            now = time.monotonic()
+            budget = self._budget(host)
+            wait = budget.wait_time(method, now)
+            if wait <= 0:
+                budget.consume(method, now)
+                return 0
+            return wait
+
+    def acquire(self, host, method=None):
+        # Returns the seconds waited, pass time.monotonic() taken right after it as
+        # update(sent=...) so late answers don't count against the next window
+        waited = 0
+
+        while True:
+            wait = self.reserve(host, method)
+            if wait <= 0:
+                return waited
+
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, host, method=None):
+        # acquire() for the event loop: waiting on one host's budget holds no thread
+        waited = 0
+
+        while True:
+            wait = self.reserve(host, method)
+            if wait <= 0:
+                return waited
+
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def update(self, host, method, headers, sent=None):
+        with self.lock:
+            self._budget(host).update(method, headers, time.monotonic(), sent)
+
+    def block(self, host, seconds, method=None):
+        # After a 429: the whole app, or only one method if Riot says so
+        with self.lock:
+            self._budget(host).block(time.monotonic() + seconds, method)
@@ -0,0 +1,111 @@
+import random
+import threading
+import time
+
+
+class RetryPolicy:
+    RETRY_STATUSES = (500, 502, 503, 504)
+
+    def __init__(self, max_attempts=5, base_delay=0.5, max_delay=30, max_rate_limited=20):
+        self.max_attempts = max_attempts
+        # 429s have their own budget: the limiter already waits out Retry-After,
+        # so they are not failures and don't use up max_attempts
+        self.max_rate_limited = max_rate_limited
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry(self, status_code):
+        return status_code in self.RETRY_STATUSES
+
+    def backoff(self, attempt):
+        # Exponential backoff with full jitter so parallel workers don't retry in sync
+        ceiling = min(self.max_delay, self.base_delay * (2**attempt))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    # Per host: after failure_threshold requests in a row failed (every retry used
+    # up), fail fast for reset_timeout seconds, then let a single trial request
+    # through (half-open). Callers wait for the trial instead of being turned away
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Condition()
+        self.failures = {}
+        self.opened_at = {}
+        # Bumped every time a host's circuit opens, to tell a failed trial
+        self.openings = {}
+        # host -> thread running the half-open trial request
+        self.trial_running = {}
+
+    def allow(self, host):
+        with self.lock:
+            return self._allow(host)
+
+    def _allow(self, host):
+        opened_at = self.opened_at.get(host)
+        if opened_at is None:
+            return True
+
+        if time.monotonic() - opened_at < self.reset_timeout:
+            return False
+
+        if host in self.trial_running:
+            return False
+        self.trial_running[host] = threading.get_ident()
+        return True
+
+    def wait(self, host):
+        # Blocks while the circuit is open. True: closed again, or this caller runs
+        # the trial. False: the trial it waited for failed, the host is still down
+        with self.lock:
+            opening = self.openings.get(host)
+            while not self._allow(host):
+                if self.openings.get(host) != opening:
+                    return False
+                remaining = self.reset_timeout - (time.monotonic() - self.opened_at[host])
+                # Past the timeout another caller runs the trial: its verdict notifies
+                self.lock.wait(remaining if remaining > 0 else None)
+            return True
+
+    def retry_in(self, host):
+        # Seconds until an open circuit lets a trial through, 0 when closed. Only
+        # a hint, it claims nothing: the request still goes through wait()
+        with self.lock:
+            opened_at = self.opened_at.get(host)
+            if opened_at is None:
+                return 0
+            return max(0, self.reset_timeout - (time.monotonic() - opened_at))
+
+    def record_success(self, host):
+        with self.lock:
+            self.failures.pop(host, None)
+            self.opened_at.pop(host, None)
+            self.trial_running.pop(host, None)
+            self.lock.notify_all()
+
+    def record_failure(self, host):
+        # Once per request that failed for good, not per attempt: one bad match ID
+        # retried max_attempts times must not take its whole host down
+        with self.lock:
+            self.failures[host] = self.failures.get(host, 0) + 1
+            half_open = self.trial_running.pop(host, None) is not None
+
+            if half_open or self.failures[host] >= self.failure_threshold:
+                if host not in self.opened_at or half_open:
+                    print(f"Circuit open for {host} ({self.failures[host]} failures)")
+                    self.openings[host] = self.openings.get(host, 0) + 1
+                self.opened_at[host] = time.monotonic()
+            self.lock.notify_all()
+
+    def release_trial(self, host):
+        # The trial ended without a verdict (rate limited, parser error): let the next
+        # one through instead of leaving the host locked. Only the thread that ran it
+        with self.lock:
+            if self.trial_running.get(host) == threading.get_ident():
+                del self.trial_running[host]
+                self.lock.notify_all()
+
+    def is_open(self, host):
+        with self.lock:
+            return host in self.opened_at
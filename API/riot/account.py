@@ -1,10 +1,20 @@
-from ..Core import Core
+from ..Core import Core, AsyncCore
 
 
 class RiotAccountAPI(Core):
     def get_puuid(self, game_name, tag_line, region="europe"):
         url = self._build_region_url(region, f"/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}")
-        data = self._make_request(url)
+        data = self._make_request(url, method="account-v1.getByRiotId")
+
+        if data:
+            return data["puuid"]
+        return None
+
+
+class AsyncRiotAccountAPI(AsyncCore, RiotAccountAPI):
+    async def get_puuid(self, game_name, tag_line, region="europe"):
+        url = self._build_region_url(region, f"/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}")
+        data = await self._make_request(url, method="account-v1.getByRiotId")
 
         if data:
             return data["puuid"]
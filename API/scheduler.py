@@ -0,0 +1,107 @@
+from concurrent.futures import Future
+import asyncio
+import itertools
+import queue
+import threading
+import time
+
+
+# Lower runs first
+PROFILE = 0
+RECENT_DETAILS = 1
+TIMELINES = 2
+HISTORY = 3
+
+
+class FetchScheduler:
+    # Queued work runs by priority class, then earliest deadline, then submission order
+    def __init__(self, workers=4):
+        self.queue = queue.PriorityQueue()
+        self.counter = itertools.count()
+        self.threads = []
+
+        for i in range(workers):
+            thread = threading.Thread(
+                target=self._work, name=f"riot-scheduler-{i}", daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, priority, fn, *args, deadline=None, **kwargs):
+        # deadline: seconds from now, only orders work inside the same priority
+        due = time.monotonic() + deadline if deadline is not None else float("inf")
+        future = Future()
+        self.queue.put((priority, due, next(self.counter), future, fn, args, kwargs))
+        return future
+
+    def pending(self):
+        return self.queue.qsize()
+
+    def _work(self):
+        while True:
+            priority, _, _, future, fn, args, kwargs = self.queue.get()
+            if fn is None:
+                break
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait=True):
+        # Sentinels sort after every real job, so queued work still runs first
+        for _ in self.threads:
+            self.queue.put((float("inf"), float("inf"), next(self.counter), None, None, (), {}))
+        if wait:
+            for thread in self.threads:
+                thread.join()
+
+
+class AsyncFetchScheduler:
+    # FetchScheduler for coroutines: worker tasks on the running event loop await
+    # the jobs in the same order (priority class, then deadline, then submission)
+    def __init__(self, workers=4):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.PriorityQueue()
+        self.counter = itertools.count()
+        self.tasks = [self.loop.create_task(self._work()) for _ in range(workers)]
+
+    def submit(self, priority, fn, *args, deadline=None, **kwargs):
+        # fn is a coroutine function, the returned future belongs to the loop
+        due = time.monotonic() + deadline if deadline is not None else float("inf")
+        future = self.loop.create_future()
+        self.queue.put_nowait((priority, due, next(self.counter), future, fn, args, kwargs))
+        return future
+
+    def pending(self):
+        return self.queue.qsize()
+
+    async def _work(self):
+        while True:
+            priority, _, _, future, fn, args, kwargs = await self.queue.get()
+            if fn is None:
+                break
+
+            if future.cancelled():
+                continue
+
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+
+    async def shutdown(self, wait=True):
+        # Sentinels sort after every real job, so queued work still runs first
+        for _ in self.tasks:
+            self.queue.put_nowait(
+                (float("inf"), float("inf"), next(self.counter), None, None, (), {})
+            )
+        if wait:
+            await asyncio.gather(*self.tasks)
@@ -0,0 +1,283 @@
+"""
+Benchmark for the match analytics hot path.
+
+    python -m perf.bench_pipeline --matches 100 10000 --timelines 0.1
+    python -m perf.bench_pipeline --matches 100000 --memory --json results.json
+    python -m perf.bench_pipeline --cassette year.jsonl.gz --game-name X --tag-line Y
+    python -m perf.bench_pipeline --matches 5000 --timelines 0.2 --check
+
+Synthetic runs time each Player stage on generated match-v5 / timeline payloads,
+cassette runs replay a recorded session end to end (see RiotClient(record_to=...)).
+--check compares the numpy (MatchColumns) and pure Python (StatsAccumulator)
+aggregates on the same rows, --aggregate picks the one a run is timed with.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from API.client import RiotClient
+from API.models.columns import MatchColumns, np
+from API.models.player import Player
+from API.models.stats import StatsAccumulator
+from perf.synthetic import SyntheticMatchGenerator
+
+
+class StageTimer:
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.stages = {}
+
+    def start(self):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+
+    def add(self, name, seconds, items):
+        stage = self.stages.setdefault(
+            name, {"seconds": 0.0, "items": 0, "peak_memory_mb": None}
+        )
+        stage["seconds"] += seconds
+        stage["items"] += items
+
+    def stop(self, name):
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            stage = self.stages[name]
+            stage["peak_memory_mb"] = round(max(stage["peak_memory_mb"] or 0, peak), 1)
+
+    def report(self):
+        for stage in self.stages.values():
+            seconds = stage["seconds"]
+            stage["seconds"] = round(seconds, 4)
+            stage["items_per_second"] = round(stage["items"] / seconds, 1) if seconds else None
+        return self.stages
+
+
+def bench_player(generator):
+    player = Player(
+        "Bench",
+        "0000",
+        client=RiotClient(api_key="bench", cache_path=None),
+    )
+    player.puuid = generator.puuid
+    player.summoner_info = {"summonerLevel": 300}
+    player.rank_info = [{"queueType": "RANKED_SOLO_5x5", "tier": "GOLD", "rank": "II"}]
+    return player
+
+
+AGGREGATES = {"columns": MatchColumns, "accumulator": StatsAccumulator}
+
+
+def run_synthetic(count, timeline_ratio=0.0, seed=0, trace_memory=False, aggregate=None):
+    # aggregate: "columns" or "accumulator", None for what Player would pick
+    generator = SyntheticMatchGenerator(seed=seed)
+    player = bench_player(generator)
+    timer = StageTimer(trace_memory)
+    timeline_every = round(1 / timeline_ratio) if timeline_ratio else 0
+
+    # Payloads are generated and dropped one by one: only extraction is timed
+    processed_stats = []
+    # Filled during extraction like Player.process_matches does
+    aggregate = AGGREGATES[aggregate]() if aggregate else player._new_aggregate()
+    timer.start()
+    for index, match in enumerate(generator.matches(count)):
+        started = time.perf_counter()
+        stats = player._extract_match_stats(match)
+        timer.add("extract_match_stats", time.perf_counter() - started, 1)
+
+        if timeline_every and index % timeline_every == 0:
+            timeline = generator.timeline(match)
+            started = time.perf_counter()
+            timeline_stats = player._extract_timeline_stats(match, timeline)
+            timer.add("extract_timeline_stats", time.perf_counter() - started, 1)
+            if timeline_stats:
+                stats.update(timeline_stats)
+
+        processed_stats.append(stats)
+        started = time.perf_counter()
+        aggregate.append(stats)
+        timer.add("fill_aggregate", time.perf_counter() - started, 1)
+    timer.stop("extract_match_stats")
+    if timeline_every:
+        timer.stop("extract_timeline_stats")
+
+    timer.start()
+    started = time.perf_counter()
+    player.aggregated_stats = player._aggregate_stats(processed_stats, aggregate)
+    timer.add("aggregate_stats", time.perf_counter() - started, count)
+    timer.stop("aggregate_stats")
+
+    timer.start()
+    started = time.perf_counter()
+    player.add_benchmarks()
+    timer.add("add_benchmarks", time.perf_counter() - started, 1)
+    timer.stop("add_benchmarks")
+
+    timer.start()
+    started = time.perf_counter()
+    player.identify_weaknesses()
+    timer.add("identify_weaknesses", time.perf_counter() - started, 1)
+    timer.stop("identify_weaknesses")
+
+    return timer.report()
+
+
+def run_cassette(
+    path,
+    game_name,
+    tag_line,
+    year,
+    region,
+    platform,
+    latency,
+    trace_memory=False,
+    rate_limited=False,
+):
+    client = RiotClient(
+        replay_from=path, replay_latency=latency, replay_rate_limited=rate_limited
+    )
+    player = Player(game_name, tag_line, region, platform, client=client)
+    timer = StageTimer(trace_memory)
+
+    stages = [
+        ("load_profile", player.load_profile, lambda: 1),
+        ("load_year_matches", lambda: player.load_year_matches(year), lambda: len(player.match_history)),
+        ("load_match_details", player.load_match_details, lambda: len(player.matches)),
+        ("process_matches", player.process_matches, lambda: len(player.matches)),
+    ]
+    for name, stage, items in stages:
+        timer.start()
+        started = time.perf_counter()
+        stage()
+        timer.add(name, time.perf_counter() - started, items())
+        timer.stop(name)
+
+    client.close()
+    return timer.report()
+
+
+def synthetic_rows(player, generator, count, timeline_ratio=0.0):
+    timeline_every = round(1 / timeline_ratio) if timeline_ratio else 0
+    rows = []
+    for index, match in enumerate(generator.matches(count)):
+        timeline = (
+            generator.timeline(match)
+            if timeline_every and index % timeline_every == 0
+            else None
+        )
+        rows.append(player._extract_stats(match, timeline))
+    return rows
+
+
+def close_enough(a, b):
+    # Sums run in a different order: floats may differ in the last bits
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(close_enough(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(close_enough(x, y) for x, y in zip(a, b))
+    if isinstance(a, float) or isinstance(b, float):
+        return abs(a - b) <= 1e-9 * max(1, abs(a), abs(b))
+    return a == b
+
+
+def check_aggregates(count, timeline_ratio=0.0, seed=0):
+    # Every aggregate backend Player may use must give the same output, and the
+    # same role stats as the row by row fallback of get_role_specific_stats
+    generator = SyntheticMatchGenerator(seed=seed)
+    player = bench_player(generator)
+    rows = synthetic_rows(player, generator, count, timeline_ratio)
+
+    backends = AGGREGATES if np is not None else {"accumulator": StatsAccumulator}
+    if np is None:
+        print("numpy not installed: MatchColumns not checked")
+
+    outputs = {}
+    for name, aggregate in backends.items():
+        player.aggregated_stats = player._aggregate_stats(rows, aggregate().extend(rows))
+        roles = list(player.aggregated_stats["role_distribution"])
+        by_aggregate = [player.get_role_specific_stats(role) for role in roles]
+        player.aggregate = None
+        by_rows = [player.get_role_specific_stats(role) for role in roles]
+        outputs[name] = player.aggregated_stats
+        if not close_enough(by_aggregate, by_rows):
+            print(f"{count} matches: {name} role stats DIFFER from the rows")
+            return False
+
+    first, *others = outputs.values()
+    same = all(close_enough(first, other) for other in others)
+    print(f"{count} matches: {', '.join(outputs)} {'agree' if same else 'DIFFER'}")
+    return same
+
+
+def print_report(title, stages):
+    print(f"\n{'=' * 72}")
+    print(f"  {title}")
+    print(f"{'=' * 72}")
+    print(f"  {'stage':<26}{'seconds':>10}{'items':>10}{'items/s':>14}{'peak MB':>10}")
+    for name, stage in stages.items():
+        peak = stage["peak_memory_mb"]
+        rate = stage["items_per_second"]
+        print(
+            f"  {name:<26}{stage['seconds']:>10.4f}{stage['items']:>10}"
+            f"{rate if rate is not None else '-':>14}{peak if peak is not None else '-':>10}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Match analytics pipeline benchmark")
+    parser.add_argument("--matches", type=int, nargs="+", default=[100, 10000])
+    parser.add_argument("--timelines", type=float, default=0.0, help="share of matches with a timeline (0-1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory", action="store_true", help="trace peak memory per stage (slower)")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--cassette", help="replay a recorded session instead of synthetic data")
+    parser.add_argument("--game-name")
+    parser.add_argument("--tag-line")
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--region", default="europe")
+    parser.add_argument("--platform", default="euw1")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per replayed call")
+    parser.add_argument("--rate-limited", action="store_true", help="pace the replay with the recorded rate limits")
+    parser.add_argument("--aggregate", choices=sorted(AGGREGATES), help="aggregate backend to time (default: numpy if installed)")
+    parser.add_argument("--check", action="store_true", help="compare both aggregate backends and exit")
+    args = parser.parse_args()
+
+    if args.check:
+        same = all(check_aggregates(count, args.timelines, args.seed) for count in args.matches)
+        raise SystemExit(0 if same else 1)
+
+    if args.memory:
+        tracemalloc.start()
+
+    results = {}
+    if args.cassette:
+        title = f"cassette {args.cassette}"
+        results[title] = run_cassette(
+            args.cassette,
+            args.game_name,
+            args.tag_line,
+            args.year,
+            args.region,
+            args.platform,
+            args.latency,
+            args.memory,
+            args.rate_limited,
+        )
+        print_report(title, results[title])
+    else:
+        for count in args.matches:
+            title = f"{count} matches, {args.timelines:.0%} with timelines"
+            results[title] = run_synthetic(
+                count, args.timelines, args.seed, args.memory, args.aggregate
+            )
+            print_report(title, results[title])
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
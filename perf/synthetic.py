@@ -0,0 +1,284 @@
+import random
+
+
+ROLES = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
+
+CHAMPIONS = [
+    (266, "Aatrox"),
+    (103, "Ahri"),
+    (84, "Akali"),
+    (22, "Ashe"),
+    (53, "Blitzcrank"),
+    (51, "Caitlyn"),
+    (122, "Darius"),
+    (119, "Draven"),
+    (81, "Ezreal"),
+    (114, "Fiora"),
+    (86, "Garen"),
+    (104, "Graves"),
+    (39, "Irelia"),
+    (40, "Janna"),
+    (222, "Jinx"),
+    (64, "LeeSin"),
+    (99, "Lux"),
+    (21, "MissFortune"),
+    (25, "Morgana"),
+    (111, "Nautilus"),
+    (555, "Pyke"),
+    (92, "Riven"),
+    (412, "Thresh"),
+    (4, "TwistedFate"),
+    (67, "Vayne"),
+    (254, "Vi"),
+    (157, "Yasuo"),
+    (238, "Zed"),
+]
+
+# Ranked solo, flex, draft, ARAM, Arena
+QUEUES = [420, 420, 420, 440, 400, 450, 1700]
+
+EVENT_TYPES = [
+    "ITEM_PURCHASED",
+    "SKILL_LEVEL_UP",
+    "WARD_PLACED",
+    "ITEM_DESTROYED",
+    "LEVEL_UP",
+    "WARD_KILL",
+    "ITEM_SOLD",
+]
+
+# 2024-01-01 00:00 UTC
+YEAR_START_MS = 1704067200000
+YEAR_MS = 366 * 24 * 3600 * 1000
+
+
+class SyntheticMatchGenerator:
+    # Deterministic match-v5 / timeline payloads: match i is the same on every run
+    def __init__(self, puuid="BENCH-PUUID", seed=0, platform="EUW1", pool_size=5000):
+        self.puuid = puuid
+        self.seed = seed
+        self.platform = platform
+        self.pool_size = pool_size
+
+    def _rng(self, index, salt=0):
+        return random.Random((self.seed * 1_000_003 + index) * 7 + salt)
+
+    def match_id(self, index):
+        return f"{self.platform}_{7000000000 + index}"
+
+    def matches(self, count):
+        for index in range(count):
+            yield self.match(index)
+
+    def match(self, index):
+        rng = self._rng(index)
+        duration = rng.randint(15 * 60, 45 * 60)
+        creation = YEAR_START_MS + rng.randrange(YEAR_MS)
+        winning_team = rng.choice((100, 200))
+
+        others = rng.sample(range(self.pool_size), 9)
+        puuids = [self.puuid] + [f"SYNTH-{other}" for other in others]
+        rng.shuffle(puuids)
+
+        participants = [
+            self._participant(rng, i, puuid, duration, winning_team)
+            for i, puuid in enumerate(puuids)
+        ]
+
+        return {
+            "metadata": {
+                "dataVersion": "2",
+                "matchId": self.match_id(index),
+                "participants": puuids,
+            },
+            "info": {
+                "endOfGameResult": "GameComplete",
+                "gameCreation": creation,
+                "gameDuration": duration,
+                "gameEndTimestamp": creation + duration * 1000 + 60000,
+                "gameId": 7000000000 + index,
+                "gameMode": "CLASSIC",
+                "gameType": "MATCHED_GAME",
+                "gameVersion": "14.10.585.2478",
+                "mapId": 11,
+                "platformId": self.platform,
+                "queueId": rng.choice(QUEUES),
+                "participants": participants,
+                "teams": [
+                    {"teamId": team, "win": team == winning_team, "bans": []}
+                    for team in (100, 200)
+                ],
+            },
+        }
+
+    def _participant(self, rng, i, puuid, duration, winning_team):
+        minutes = duration / 60
+        team = 100 if i < 5 else 200
+        role = ROLES[i % 5]
+        champion_id, champion_name = rng.choice(CHAMPIONS)
+        support = role == "UTILITY"
+        kills = rng.randint(0, 15)
+        deaths = rng.randint(0, 12)
+
+        return {
+            "puuid": puuid,
+            "participantId": i + 1,
+            "teamId": team,
+            "teamPosition": role,
+            "individualPosition": role,
+            "championId": champion_id,
+            "championName": champion_name,
+            "summonerLevel": rng.randint(30, 600),
+            "win": team == winning_team,
+            "kills": kills,
+            "deaths": deaths,
+            "assists": rng.randint(0, 25),
+            "totalMinionsKilled": int(minutes * rng.uniform(0.5, 2) if support else minutes * rng.uniform(4, 9)),
+            "neutralMinionsKilled": int(minutes * rng.uniform(3, 6)) if role == "JUNGLE" else rng.randint(0, 8),
+            "goldEarned": int(minutes * rng.uniform(250, 480)),
+            "totalDamageDealtToChampions": int(minutes * rng.uniform(300, 1100)),
+            "totalDamageDealt": int(minutes * rng.uniform(3000, 8000)),
+            "totalDamageTaken": int(minutes * rng.uniform(500, 1200)),
+            "visionScore": int(minutes * rng.uniform(0.4, 3 if support else 1.2)),
+            "wardsPlaced": rng.randint(3, 60 if support else 20),
+            "wardsKilled": rng.randint(0, 15),
+            "detectorWardsPlaced": rng.randint(0, 12),
+            "turretKills": rng.randint(0, 4),
+            "inhibitorKills": rng.randint(0, 2),
+            "dragonKills": rng.randint(0, 4) if role == "JUNGLE" else 0,
+            "baronKills": rng.randint(0, 2) if role == "JUNGLE" else 0,
+            "doubleKills": rng.randint(0, kills // 3 + 1),
+            "tripleKills": rng.randint(0, 1),
+            "quadraKills": 0,
+            "pentaKills": 0,
+            "champLevel": rng.randint(10, 18),
+            "item0": rng.randint(1000, 7000),
+            "item1": rng.randint(1000, 7000),
+            "item2": rng.randint(1000, 7000),
+            "item3": rng.randint(1000, 7000),
+            "item4": rng.randint(1000, 7000),
+            "item5": rng.randint(1000, 7000),
+            "item6": 3340,
+            "summoner1Id": 4,
+            "summoner2Id": rng.choice((7, 11, 12, 14)),
+            # Real payloads carry ~120 challenge keys, enough here to weigh the same order
+            "challenges": {
+                f"challenge{k}": round(rng.uniform(0, 100), 3) for k in range(60)
+            },
+            "perks": {
+                "statPerks": {"defense": 5001, "flex": 5008, "offense": 5005},
+                "styles": [
+                    {
+                        "description": "primaryStyle",
+                        "style": 8000,
+                        "selections": [
+                            {"perk": 8000 + k, "var1": rng.randint(0, 900), "var2": 0, "var3": 0}
+                            for k in range(4)
+                        ],
+                    },
+                    {
+                        "description": "subStyle",
+                        "style": 8300,
+                        "selections": [
+                            {"perk": 8300 + k, "var1": rng.randint(0, 900), "var2": 0, "var3": 0}
+                            for k in range(2)
+                        ],
+                    },
+                ],
+            },
+        }
+
+    def timeline(self, match):
+        index = int(match["metadata"]["matchId"].split("_")[1]) - 7000000000
+        rng = self._rng(index, salt=1)
+        duration = match["info"]["gameDuration"]
+        deaths = {
+            p["participantId"]: p["deaths"] for p in match["info"]["participants"]
+        }
+
+        kill_events = []
+        for participant_id, count in deaths.items():
+            for _ in range(count):
+                kill_events.append(
+                    {
+                        "type": "CHAMPION_KILL",
+                        "timestamp": rng.randrange(60000, duration * 1000),
+                        "victimId": participant_id,
+                        "killerId": rng.randint(1, 10),
+                        "assistingParticipantIds": rng.sample(range(1, 11), 2),
+                        "bounty": 300,
+                        "shutdownBounty": 0,
+                        "position": {"x": rng.randint(0, 14800), "y": rng.randint(0, 14800)},
+                        "victimDamageReceived": [
+                            {"basic": True, "magicDamage": rng.randint(0, 900), "name": "SRU", "participantId": rng.randint(1, 10)}
+                            for _ in range(4)
+                        ],
+                    }
+                )
+
+        frames = []
+        for minute in range(duration // 60 + 2):
+            timestamp = minute * 60000
+            events = [
+                {
+                    "type": rng.choice(EVENT_TYPES),
+                    "timestamp": timestamp + rng.randrange(60000),
+                    "participantId": rng.randint(1, 10),
+                    "itemId": rng.randint(1000, 7000),
+                }
+                for _ in range(rng.randint(15, 45))
+            ]
+            events.extend(
+                event
+                for event in kill_events
+                if timestamp <= event["timestamp"] < timestamp + 60000
+            )
+            events.sort(key=lambda event: event["timestamp"])
+
+            frames.append(
+                {
+                    "timestamp": timestamp,
+                    "events": events,
+                    "participantFrames": {
+                        str(participant_id): self._participant_frame(rng, participant_id, minute)
+                        for participant_id in range(1, 11)
+                    },
+                }
+            )
+
+        return {
+            "metadata": {
+                "dataVersion": "2",
+                "matchId": match["metadata"]["matchId"],
+                "participants": match["metadata"]["participants"],
+            },
+            "info": {
+                "frameInterval": 60000,
+                "frames": frames,
+                "gameId": match["info"]["gameId"],
+                "participants": [
+                    {"participantId": p["participantId"], "puuid": p["puuid"]}
+                    for p in match["info"]["participants"]
+                ],
+            },
+        }
+
+    def _participant_frame(self, rng, participant_id, minute):
+        return {
+            "participantId": participant_id,
+            "level": min(18, 1 + minute // 2),
+            "xp": minute * rng.randint(300, 500),
+            "currentGold": rng.randint(0, 3000),
+            "totalGold": 500 + minute * rng.randint(250, 450),
+            "goldPerSecond": 0,
+            "minionsKilled": minute * rng.randint(4, 9),
+            "jungleMinionsKilled": minute * rng.randint(0, 5),
+            "timeEnemySpentControlled": rng.randint(0, 50000),
+            "position": {"x": rng.randint(0, 14800), "y": rng.randint(0, 14800)},
+            "championStats": {
+                f"stat{k}": rng.randint(0, 500) for k in range(25)
+            },
+            "damageStats": {
+                f"damage{k}": rng.randint(0, 50000) for k in range(12)
+            },
+        }
@@ -0,0 +1,120 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+import json
+import threading
+import time
+
+
+PUUID = "PUUID-0"
+
+
+def make_match(match_id, game_creation=1704067200000, puuids=None):
+    puuids = puuids or [PUUID] + [f"PUUID-{i}" for i in range(1, 10)]
+    positions = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
+    participants = [
+        {
+            "puuid": puuid,
+            "participantId": i + 1,
+            "teamPosition": positions[i % 5],
+            "championId": 10 + i % 3,
+            "championName": f"Champion{i % 3}",
+            "win": i < 5,
+            "kills": 3 + i,
+            "deaths": 2,
+            "assists": 5,
+            "totalMinionsKilled": 150,
+            "neutralMinionsKilled": 10,
+            "goldEarned": 10000,
+            "totalDamageDealtToChampions": 20000,
+            "visionScore": 25,
+            "wardsPlaced": 10,
+            "wardsKilled": 2,
+            "detectorWardsPlaced": 3,
+            "turretKills": 1,
+            "inhibitorKills": 0,
+            "doubleKills": 1,
+            "tripleKills": 0,
+            "quadraKills": 0,
+            "pentaKills": 0,
+            "summonerLevel": 100,
+        }
+        for i, puuid in enumerate(puuids)
+    ]
+    return {
+        "metadata": {"matchId": match_id, "participants": puuids},
+        "info": {
+            "gameDuration": 1800,
+            "gameCreation": game_creation,
+            "gameEndTimestamp": game_creation + 1800000,
+            "queueId": 420,
+            "participants": participants,
+        },
+    }
+
+
+class StandInServer:
+    # Local stand-in for the Riot API, point a RiotClient at it with base_urls
+    def __init__(self, match_ids=(), delay=0.0):
+        self.match_ids = list(match_ids)
+        self.delay = delay
+        # path substring -> status returned on every call
+        self.failing = {}
+        self.lock = threading.Lock()
+        self.paths = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                status, body = server.respond(self.path)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def calls(self, fragment=""):
+        with self.lock:
+            return sum(1 for path in self.paths if fragment in path)
+
+    def respond(self, raw_path):
+        with self.lock:
+            self.paths.append(raw_path)
+        if self.delay:
+            time.sleep(self.delay)
+
+        url = urlparse(raw_path)
+        path = url.path
+        for fragment, status in self.failing.items():
+            if fragment in path:
+                return status, {"status": {"status_code": status}}
+
+        if "/by-riot-id/" in path:
+            return 200, {"puuid": PUUID, "gameName": "Stand", "tagLine": "In"}
+        if "/summoners/by-puuid/" in path:
+            return 200, {"summonerLevel": 321}
+        if path.endswith("/ids"):
+            query = parse_qs(url.query)
+            start = int(query.get("start", ["0"])[0])
+            count = int(query.get("count", ["20"])[0])
+            return 200, list(reversed(self.match_ids))[start : start + count]
+        if "/lol/match/v5/matches/" in path:
+            return 200, make_match(path.rsplit("/", 1)[-1])
+        return 404, {"status": {"status_code": 404}}
@@ -0,0 +1,67 @@
+from API.client import RiotClient
+from API.league.match import AsyncMatch
+from API.league.summoner import AsyncSummoner
+from API.ratelimit import RateLimiter
+from tests.stand_in import PUUID, StandInServer
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+
+class AsyncHostIsolationTest(unittest.TestCase):
+    def test_exhausted_host_does_not_hold_back_others(self):
+        match_ids = [f"EUW1_{i}" for i in range(12)]
+        with StandInServer(match_ids) as europe, StandInServer() as euw1:
+            client = RiotClient(
+                api_key="stand-in",
+                base_urls={"europe": europe.url, "euw1": euw1.url},
+                cache_path=None,
+                rate_limiter=RateLimiter("2:1"),
+                max_in_flight=2,
+            )
+
+            async def run():
+                bulk = asyncio.ensure_future(
+                    AsyncMatch(client).get_bulk_match_details(match_ids)
+                )
+                # Let the bulk use up europe's budget first
+                await asyncio.sleep(0.1)
+
+                started = time.monotonic()
+                summoner = await AsyncSummoner(client).get_summoner_infos(PUUID)
+                elapsed = time.monotonic() - started
+                return summoner, elapsed, await bulk
+
+            summoner, elapsed, matches = asyncio.run(run())
+            client.close()
+
+        self.assertEqual(summoner["summonerLevel"], 321)
+        self.assertLess(elapsed, 1)
+        self.assertEqual(len(matches), 12)
+
+
+class AsyncMonthCacheTest(unittest.TestCase):
+    def test_closed_months_are_listed_once(self):
+        match_ids = [f"EUW1_{i}" for i in range(5)]
+        with StandInServer(match_ids) as server, tempfile.TemporaryDirectory() as tmp:
+            client = RiotClient(
+                api_key="stand-in",
+                base_urls={"europe": server.url},
+                cache_path=os.path.join(tmp, "matches.sqlite3"),
+            )
+            match_api = AsyncMatch(client)
+
+            first = asyncio.run(match_api.get_year_match_history(PUUID, year=2024))
+            listed = server.calls("/ids")
+            second = asyncio.run(match_api.get_year_match_history(PUUID, year=2024))
+            client.close()
+
+        self.assertEqual(listed, 12)
+        self.assertEqual(server.calls("/ids"), listed)
+        self.assertEqual(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
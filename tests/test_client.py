@@ -0,0 +1,59 @@
+from API.client import RiotClient
+from API.league.match import Match
+from API.retry import CircuitBreaker, RetryPolicy
+from tests.stand_in import StandInServer
+import unittest
+
+
+def stand_in_client(server, **kwargs):
+    return RiotClient(
+        api_key="stand-in",
+        base_urls={"europe": server.url, "euw1": server.url},
+        cache_path=None,
+        **kwargs,
+    )
+
+
+class CircuitBreakerBulkTest(unittest.TestCase):
+    def test_one_failing_id_leaves_no_holes(self):
+        match_ids = [f"EUW1_{i}" for i in range(60)]
+        with StandInServer(match_ids) as server:
+            server.failing["EUW1_10"] = 503
+            client = stand_in_client(
+                server, retry_policy=RetryPolicy(max_attempts=5, base_delay=0.001)
+            )
+
+            matches, failed = Match(client).get_bulk_match_details(
+                match_ids, return_failed=True
+            )
+            client.close()
+
+        self.assertEqual(failed, ["EUW1_10"])
+        self.assertEqual(len(matches), 59)
+        self.assertEqual(server.calls("EUW1_10"), 5)
+
+    def test_open_circuit_waits_for_the_trial(self):
+        with StandInServer(["EUW1_1"]) as server:
+            breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.2)
+            client = stand_in_client(
+                server,
+                retry_policy=RetryPolicy(max_attempts=1, base_delay=0.001),
+                circuit_breaker=breaker,
+            )
+            match_api = Match(client)
+
+            server.failing["EUW1_1"] = 500
+            self.assertIsNone(match_api.get_match_details("EUW1_1"))
+            self.assertTrue(breaker.is_open(server.url.split("//")[1]))
+
+            # Held until the reset timeout, then sent as the trial instead of skipped
+            del server.failing["EUW1_1"]
+            match = match_api.get_match_details("EUW1_1")
+            client.close()
+
+        self.assertEqual(match["metadata"]["matchId"], "EUW1_1")
+        self.assertFalse(breaker.is_open(server.url.split("//")[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
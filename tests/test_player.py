@@ -0,0 +1,88 @@
+from API.client import RiotClient
+from API.models.group import MatchStore
+from API.models.player import AsyncPlayer, Player
+from API.ratelimit import RateLimiter
+from tests.stand_in import PUUID, StandInServer
+import asyncio
+import threading
+import unittest
+
+
+class LoadPrioritizedTest(unittest.TestCase):
+    def test_close_while_history_is_scheduled(self):
+        match_ids = [f"EUW1_{i}" for i in range(30)]
+        with StandInServer(match_ids, delay=0.01) as server:
+            client = RiotClient(
+                api_key="stand-in",
+                base_urls={"europe": server.url, "euw1": server.url},
+                cache_path=None,
+            )
+            player = Player("Stand", "In", client=client)
+            futures = player.load_prioritized(recent=5, with_timelines=False)
+
+            # close() drains the scheduler while the history job still submits to it
+            closing = threading.Thread(target=client.close, daemon=True)
+            closing.start()
+            closing.join(timeout=60)
+
+        self.assertFalse(closing.is_alive())
+        self.assertTrue(futures["history"].done())
+        self.assertEqual(len(futures["history"].result()), 25)
+
+
+class AsyncLoadPrioritizedTest(unittest.TestCase):
+    def test_recent_then_history(self):
+        match_ids = [f"EUW1_{i}" for i in range(30)]
+        with StandInServer(match_ids) as server:
+            client = RiotClient(
+                api_key="stand-in",
+                base_urls={"europe": server.url, "euw1": server.url},
+                cache_path=None,
+                rate_limiter=RateLimiter("1000:1"),
+            )
+            player = AsyncPlayer("Stand", "In", client=client)
+
+            async def run():
+                futures = await player.load_prioritized(recent=5, with_timelines=False)
+                await asyncio.gather(*futures["profile"], *futures["recent"])
+                await asyncio.gather(*await futures["history"])
+                return player.collect_loaded()
+
+            matches = asyncio.run(run())
+            client.close()
+
+        detail_paths = [path for path in server.paths if "/matches/EUW1_" in path]
+        first = {path.rsplit("/", 1)[-1] for path in detail_paths[:5]}
+        self.assertEqual(first, set(match_ids[-5:]))
+        self.assertEqual(len(detail_paths), 30)
+        self.assertEqual(len(matches), 30)
+        self.assertEqual(player.summoner_info["summonerLevel"], 321)
+
+
+class AsyncPlayerStoreTest(unittest.TestCase):
+    def test_load_match_details_skips_stored_matches(self):
+        with StandInServer() as server:
+            client = RiotClient(
+                api_key="stand-in",
+                base_urls={"europe": server.url},
+                cache_path=None,
+            )
+            store = MatchStore()
+            first = AsyncPlayer("Stand", "In", client=client, store=store)
+            second = AsyncPlayer("Stand", "In", client=client, store=store)
+            first.puuid = second.puuid = PUUID
+            first.match_history = ["EUW1_1", "EUW1_2"]
+            second.match_history = ["EUW1_2", "EUW1_3"]
+
+            asyncio.run(first.load_match_details())
+            matches = asyncio.run(second.load_match_details())
+            client.close()
+
+        self.assertEqual(server.calls("/matches/EUW1_2"), 1)
+        self.assertEqual(len(store), 3)
+        self.assertEqual(len(matches), 3)
+        self.assertIs(second.matches, matches)
+
+
+if __name__ == "__main__":
+    unittest.main()